@@ -20,6 +20,10 @@ class BaseAgent(ABC):
     logging, error handling, and state management.
     """
     
+    # Agents that read self.prefetched set this; the orchestrator skips the
+    # (billed) external lookups for agents that would ignore the results
+    uses_prefetched = False
+    
     def __init__(self, agent_name: str):
         """Initialize the base agent."""
         self.agent_name = agent_name
@@ -27,13 +31,15 @@ class BaseAgent(ABC):
         self.start_time: Optional[datetime] = None
         self.api_calls_made = 0
         self.total_api_cost = 0.0
+        self.prefetched: Dict[str, Any] = {}
     
-    async def process(self, state: MSMELoanState) -> ProcessingResult:
+    async def process(self, state: MSMELoanState, prefetched: Optional[Dict[str, Any]] = None) -> ProcessingResult:
         """
         Process the loan application state.
         
         Args:
             state: Current loan application state
+            prefetched: External API results the orchestrator already fetched, by lookup name
             
         Returns:
             Processing result with updated data and routing decision
@@ -41,6 +47,7 @@ class BaseAgent(ABC):
         self.start_time = datetime.utcnow()
         self.api_calls_made = 0
         self.total_api_cost = 0.0
+        self.prefetched = prefetched or {}
         
         try:
             self.logger.info(f"Starting {self.agent_name} processing for thread {state.thread_id}")
@@ -101,8 +108,8 @@ class BaseAgent(ABC):
                 routing_decision=RoutingDecision(
                     next_agent="error_handler",
                     routing_reason=f"Error in {self.agent_name}: {str(e)}",
-                    conditions_met=[],
-                    bypass_conditions=[]
+                    conditions_met=(),
+                    bypass_conditions=()
                 )
             )
             
@@ -142,8 +149,8 @@ class BaseAgent(ABC):
         return RoutingDecision(
             next_agent="next_agent",
             routing_reason="Default routing",
-            conditions_met=[],
-            bypass_conditions=[]
+            conditions_met=(),
+            bypass_conditions=()
         )
     
     def _log_api_call(self, api_name: str, cost: float = 0.0) -> None:
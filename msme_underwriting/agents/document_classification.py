@@ -570,8 +570,8 @@ class DocumentClassificationAgent(BaseAgent):
             return RoutingDecision(
                 next_agent="human_review",
                 routing_reason="No borrower PAN card found",
-                conditions_met=[],
-                bypass_conditions=["borrower_pan_available"]
+                conditions_met=(),
+                bypass_conditions=("borrower_pan_available",)
             )
         
         # Check confidence of borrower PAN
@@ -580,8 +580,8 @@ class DocumentClassificationAgent(BaseAgent):
             return RoutingDecision(
                 next_agent="human_review",
                 routing_reason="Low confidence in borrower PAN card extraction",
-                conditions_met=[],
-                bypass_conditions=["high_confidence_extraction"]
+                conditions_met=(),
+                bypass_conditions=("high_confidence_extraction",)
             )
         
         # Check for critical missing documents
@@ -590,8 +590,8 @@ class DocumentClassificationAgent(BaseAgent):
             return RoutingDecision(
                 next_agent="human_review",
                 routing_reason="Too many critical documents missing",
-                conditions_met=[],
-                bypass_conditions=["sufficient_documents"]
+                conditions_met=(),
+                bypass_conditions=("sufficient_documents",)
             )
         
         # Check average confidence
@@ -606,18 +606,18 @@ class DocumentClassificationAgent(BaseAgent):
                 return RoutingDecision(
                     next_agent="human_review",
                     routing_reason="Average document confidence below threshold",
-                    conditions_met=[],
-                    bypass_conditions=["minimum_confidence"]
+                    conditions_met=(),
+                    bypass_conditions=("minimum_confidence",)
                 )
         
         # Success route
         return RoutingDecision(
             next_agent="entity_kmp_identification",
             routing_reason="Sufficient documents available for entity analysis",
-            conditions_met=[
+            conditions_met=(
                 "borrower_pan_available",
                 "sufficient_document_quality",
                 "basic_documents_classified"
-            ],
-            bypass_conditions=[]
+            ),
+            bypass_conditions=()
         )
@@ -38,8 +38,8 @@ class EntityKMPIdentificationAgent(BaseAgent):
             "routing_decision": RoutingDecision(
                 next_agent="human_review",
                 routing_reason="Agent not yet implemented - routing to human review",
-                conditions_met=[],
-                bypass_conditions=["agent_not_implemented"]
+                conditions_met=(),
+                bypass_conditions=("agent_not_implemented",)
             )
         }
 
@@ -70,8 +70,8 @@ class VerificationComplianceAgent(BaseAgent):
             "routing_decision": RoutingDecision(
                 next_agent="human_review",
                 routing_reason="Agent not yet implemented - routing to human review",
-                conditions_met=[],
-                bypass_conditions=["agent_not_implemented"]
+                conditions_met=(),
+                bypass_conditions=("agent_not_implemented",)
             )
         }
 
@@ -101,8 +101,8 @@ class FinancialAnalysisAgent(BaseAgent):
             "routing_decision": RoutingDecision(
                 next_agent="human_review",
                 routing_reason="Agent not yet implemented - routing to human review",
-                conditions_met=[],
-                bypass_conditions=["agent_not_implemented"]
+                conditions_met=(),
+                bypass_conditions=("agent_not_implemented",)
             )
         }
 
@@ -128,8 +128,8 @@ class BankingAnalysisAgent(BaseAgent):
             "routing_decision": RoutingDecision(
                 next_agent="human_review",
                 routing_reason="Agent not yet implemented - routing to human review",
-                conditions_met=[],
-                bypass_conditions=["agent_not_implemented"]
+                conditions_met=(),
+                bypass_conditions=("agent_not_implemented",)
             )
         }
 
@@ -215,15 +215,15 @@ class FinalAssemblyAgent(BaseAgent):
                 overall_risk_score=1.0,
                 risk_category="Unknown",
                 risk_grade="PENDING",
-                key_strengths=[],
-                areas_of_concern=["Agents not yet implemented"],
-                recommended_mitigations=["Complete agent implementation"]
+                key_strengths=(),
+                areas_of_concern=("Agents not yet implemented",),
+                recommended_mitigations=("Complete agent implementation",)
             ),
             loan_recommendation=LoanRecommendation(
                 primary_recommendation="MANUAL REVIEW REQUIRED",
                 confidence_level="Low (0%)",
                 recommended_loan_amount=0,
-                suggested_conditions=["Complete system implementation"],
+                suggested_conditions=("Complete system implementation",),
                 proposed_terms=ProposedTerms(
                     loan_amount=0,
                     tenure="TBD",
@@ -232,11 +232,11 @@ class FinalAssemblyAgent(BaseAgent):
                     dscr=0.0
                 ),
                 estimated_processing_timeline="Pending implementation",
-                next_steps=["Implement remaining agents", "Process application manually"]
+                next_steps=("Implement remaining agents", "Process application manually")
             ),
             processing_summary=ProcessingSummary(
                 total_processing_time=0.0,
-                agents_executed=["document_classification"],
+                agents_executed=("document_classification",),
                 total_api_calls=0,
                 total_api_cost=0.0
             ),
@@ -254,7 +254,7 @@ class FinalAssemblyAgent(BaseAgent):
             "routing_decision": RoutingDecision(
                 next_agent="END",
                 routing_reason="Stub final assembly completed",
-                conditions_met=["stub_processing_complete"],
-                bypass_conditions=[]
+                conditions_met=("stub_processing_complete",),
+                bypass_conditions=()
             )
         }
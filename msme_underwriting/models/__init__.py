@@ -1,6 +1,7 @@
 """Data models for MSME underwriting system."""
 
-from .base import BaseModel, TimestampedModel
+from .base import BaseModel, TimestampedModel, ValueModel
+from .validators import PAN, GSTIN
 from .loan_application import (
     LoanApplication,
     LoanContext,
@@ -27,6 +28,8 @@ from .kmp import (
     IdentifiedKMP,
     KMPCoverageAnalysis,
     ConstitutionRequirements,
+    KYCCompleteness,
+    MissingRequirement,
 )
 from .verification import (
     BureauVerificationResults,
@@ -46,6 +49,15 @@ from .financial import (
     LeverageRatios,
     CashFlowAnalysis,
     LoanServicingCapacity,
+    MonthlyTurnover,
+    ProjectedCashFlow,
+    TurnoverAssessment,
+    ProfitabilityTrend,
+    IndustryComparison,
+    LiquidityAssessment,
+    LeverageAssessment,
+    CashFlowStability,
+    FinancialHealthLevel,
 )
 from .banking import (
     BankingAssessment,
@@ -58,9 +70,18 @@ from .banking import (
 from .state import (
     MSMELoanState,
     AgentContext,
+    EventLog,
     ProcessingMetadata,
     RoutingDecision,
 )
+from .state_typeddicts import (
+    BasicGroupIdentification,
+    CrossValidationResults,
+    PANValidation,
+    BankingIntegrationAnalysis,
+    GSTFinancialReconciliation,
+    RiskAssessmentEnhancement,
+)
 from .final_report import (
     FinalReport,
     ExecutiveSummary,
@@ -68,12 +89,18 @@ from .final_report import (
     VerificationSummary,
     RiskAssessmentSummary,
     LoanRecommendation,
+    FINAL_REPORT_SCHEMA,
 )
 
 __all__ = [
     # Base models
     "BaseModel",
     "TimestampedModel",
+    "ValueModel",
+    
+    # Identifier types
+    "PAN",
+    "GSTIN",
     
     # Loan application
     "LoanApplication",
@@ -101,6 +128,8 @@ __all__ = [
     "IdentifiedKMP",
     "KMPCoverageAnalysis",
     "ConstitutionRequirements",
+    "KYCCompleteness",
+    "MissingRequirement",
     
     # Verification
     "BureauVerificationResults",
@@ -120,6 +149,15 @@ __all__ = [
     "LeverageRatios",
     "CashFlowAnalysis",
     "LoanServicingCapacity",
+    "MonthlyTurnover",
+    "ProjectedCashFlow",
+    "TurnoverAssessment",
+    "ProfitabilityTrend",
+    "IndustryComparison",
+    "LiquidityAssessment",
+    "LeverageAssessment",
+    "CashFlowStability",
+    "FinancialHealthLevel",
     
     # Banking
     "BankingAssessment",
@@ -132,8 +170,15 @@ __all__ = [
     # State
     "MSMELoanState",
     "AgentContext",
+    "EventLog",
     "ProcessingMetadata",
     "RoutingDecision",
+    "BasicGroupIdentification",
+    "CrossValidationResults",
+    "PANValidation",
+    "BankingIntegrationAnalysis",
+    "GSTFinancialReconciliation",
+    "RiskAssessmentEnhancement",
     
     # Final report
     "FinalReport",
@@ -142,4 +187,5 @@ __all__ = [
     "VerificationSummary",
     "RiskAssessmentSummary",
     "LoanRecommendation",
+    "FINAL_REPORT_SCHEMA",
 ]
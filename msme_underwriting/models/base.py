@@ -1,8 +1,82 @@
 """Base models for the MSME underwriting system."""
 
-from datetime import datetime
-from typing import Any, Dict, Optional
-from pydantic import BaseModel as PydanticBaseModel, Field, ConfigDict
+import sys
+from datetime import datetime, timedelta, timezone
+from types import GenericAlias
+from typing import Annotated, Any, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, Union, cast
+from pydantic import (
+    BaseModel as PydanticBaseModel,
+    Field,
+    ConfigDict,
+    AfterValidator,
+    BeforeValidator,
+    PlainSerializer,
+    StringConstraints,
+    TypeAdapter,
+)
+
+# Recurring flag/indicator strings share one interned instance across models
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+# Status/category codes: lowercased once on validation so checks are plain comparisons
+LowerStr = Annotated[str, StringConstraints(to_lower=True), AfterValidator(sys.intern)]
+
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_epoch_ns(value: Any) -> Any:
+    """Convert a datetime or ISO string to integer nanoseconds since the epoch (naive = UTC)."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return ((value - _EPOCH) // _ONE_MICROSECOND) * 1000
+    return value
+
+
+def from_epoch_ns(value: int) -> datetime:
+    """Convert nanoseconds since the epoch to a naive UTC datetime."""
+    return _EPOCH + timedelta(microseconds=value // 1000)
+
+
+# Timestamps stored as int64 epoch nanoseconds; datetimes and ISO strings are accepted,
+# and dumps still emit (naive UTC) datetimes / ISO-8601 so the serialized shape is unchanged
+EpochNs = Annotated[
+    int,
+    BeforeValidator(to_epoch_ns),
+    PlainSerializer(from_epoch_ns, return_type=datetime),
+]
+
+_ItemT = TypeVar("_ItemT")
+
+
+def _share_empty(value: Sequence[Any]) -> Sequence[Any]:
+    """Replace an empty sequence with the shared empty tuple."""
+    return value if value else ()
+
+
+# Append-only sequences default to the shared () and become a list on first write
+# (see BaseModel._writable_list); empty inputs collapse back to () on validation
+AppendOnlyList = Annotated[Sequence[_ItemT], AfterValidator(_share_empty)]
+
+
+def _namedtuple_as_dict(value: Any) -> Dict[str, Any]:
+    """Serialize a NamedTuple as a mapping keyed by field name."""
+    return cast(Dict[str, Any], value._asdict())
+
+
+# Marks a NamedTuple field so it serializes as a JSON object instead of an array
+AsRecord = PlainSerializer(_namedtuple_as_dict, return_type=Dict[str, Any])
+
+# JSON schemas keyed by model class, built once on first request
+_JSON_SCHEMA_CACHE: Dict[type, Dict[str, Any]] = {}
+
+# List[Model] adapters keyed by model class, built once on first request
+_LIST_ADAPTER_CACHE: Dict[type, TypeAdapter[List[Any]]] = {}
+
+ModelT = TypeVar("ModelT", bound="BaseModel")
 
 
 class BaseModel(PydanticBaseModel):
@@ -20,6 +94,73 @@ class BaseModel(PydanticBaseModel):
         # Serialize by alias
         ser_by_alias=True,
     )
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize the model straight to JSON bytes with the compiled core serializer."""
+        return self.__pydantic_serializer__.to_json(self)
+    
+    @classmethod
+    def dump_many_json(cls: Type[ModelT], models: List[ModelT]) -> bytes:
+        """Serialize a batch of models to a JSON array in a single core call."""
+        return cls._list_adapter().dump_json(models)
+    
+    @classmethod
+    def from_json_bytes(cls: Type[ModelT], data: Union[bytes, str]) -> ModelT:
+        """Parse and validate a JSON payload in a single pass, without an intermediate dict."""
+        return cls.model_validate_json(data)
+    
+    @classmethod
+    def json_schema_cached(cls) -> Dict[str, Any]:
+        """Get the model's JSON schema, generating it only once per class."""
+        schema = _JSON_SCHEMA_CACHE.get(cls)
+        if schema is None:
+            schema = _JSON_SCHEMA_CACHE[cls] = cls.model_json_schema()
+        return schema
+    
+    @classmethod
+    def validate_many(
+        cls: Type[ModelT], data: Union[bytes, str, List[Dict[str, Any]]]
+    ) -> List[ModelT]:
+        """Validate a batch of records (a JSON array or a list of dicts) in a single core call."""
+        adapter = cls._list_adapter()
+        if isinstance(data, (bytes, str)):
+            return adapter.validate_json(data)
+        return adapter.validate_python(data)
+    
+    @classmethod
+    def _list_adapter(cls: Type[ModelT]) -> "TypeAdapter[List[ModelT]]":
+        """Get the cached List[cls] adapter used for batch validation and serialization."""
+        adapter = _LIST_ADAPTER_CACHE.get(cls)
+        if adapter is None:
+            # list[cls] is built at runtime: a class variable cannot be spelled as a static type
+            list_type: Any = GenericAlias(list, (cls,))
+            adapter = _LIST_ADAPTER_CACHE[cls] = TypeAdapter(list_type)
+        return cast("TypeAdapter[List[ModelT]]", adapter)
+    
+    def _set_trusted(self, name: str, value: Any) -> None:
+        """Assign an already-valid field value without re-running assignment validation."""
+        self.__dict__[name] = value
+        self.__pydantic_fields_set__.add(name)
+    
+    def _writable_list(self, name: str) -> list:
+        """Get a sequence field as a list, promoting a shared empty-tuple default on first write."""
+        value = self.__dict__[name]
+        if type(value) is not list:
+            value = list(value)
+            self._set_trusted(name, value)
+        return value
+
+
+class ValueModel(BaseModel):
+    """Base model for immutable, high-volume value objects."""
+    
+    model_config = ConfigDict(
+        # Drop unknown fields so instances carry no extras dict
+        extra="ignore",
+        # Value objects are never mutated after construction
+        frozen=True,
+        validate_assignment=False,
+    )
 
 
 class TimestampedModel(BaseModel):
@@ -30,7 +171,7 @@ class TimestampedModel(BaseModel):
     
     def update_timestamp(self) -> None:
         """Update the updated_at timestamp."""
-        self.updated_at = datetime.utcnow()
+        self._set_trusted("updated_at", datetime.utcnow())
 
 
 class ProcessingResult(BaseModel):
@@ -59,13 +200,13 @@ class ProcessingMetadata(BaseModel):
         return (self.end_time - self.start_time).total_seconds()
 
 
-class RoutingDecision(BaseModel):
+class RoutingDecision(ValueModel):
     """Decision about routing to next agent."""
     
     next_agent: str = Field(description="Name of the next agent to route to")
     routing_reason: str = Field(description="Reason for this routing decision")
-    conditions_met: list[str] = Field(default_factory=list, description="Conditions that were met")
-    bypass_conditions: list[str] = Field(default_factory=list, description="Conditions that were bypassed")
+    conditions_met: Tuple[str, ...] = Field(default=(), description="Conditions that were met")
+    bypass_conditions: Tuple[str, ...] = Field(default=(), description="Conditions that were bypassed")
 
 
 class ValidationResult(BaseModel):
@@ -4,7 +4,7 @@ from enum import Enum
 from typing import Dict, List, Optional, Any
 from pydantic import Field
 
-from .base import BaseModel
+from .base import BaseModel, InternedStr
 
 
 class DocumentClass(str, Enum):
@@ -117,7 +117,7 @@ class ExtractedDocument(BaseModel):
     file_name: str = Field(description="Original file name")
     document_class: DocumentClass = Field(description="Classified document type")
     extracted_data: ExtractedData = Field(description="Extracted structured data")
-    quality_flags: List[str] = Field(default_factory=list, description="Quality assessment flags")
+    quality_flags: List[InternedStr] = Field(default_factory=list, description="Quality assessment flags")
     processing_time: Optional[float] = Field(default=None, description="Processing time in seconds")
     
     # Additional metadata
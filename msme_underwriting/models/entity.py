@@ -1,15 +1,15 @@
 """Models for entity identification and profiling."""
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from pydantic import Field
 
-from .base import BaseModel, ValidationResult
+from .base import BaseModel, ValidationResult, InternedStr
 
 
 class ConstitutionEligibility(BaseModel):
     """Entity constitution eligibility assessment."""
     
-    eligible_types: List[str] = Field(description="List of eligible constitution types")
+    eligible_types: Tuple[str, ...] = Field(description="List of eligible constitution types")
     detected_type: str = Field(description="Detected constitution type")
     is_eligible: bool = Field(description="Whether the detected type is eligible")
     validation_checks: List[ValidationResult] = Field(description="Validation checks performed")
@@ -21,7 +21,7 @@ class DateOfEstablishment(BaseModel):
     
     determined_date: str = Field(description="Determined establishment date")
     source_document: str = Field(description="Source document for the date")
-    hierarchy_used: List[str] = Field(description="Document hierarchy used for determination")
+    hierarchy_used: Tuple[str, ...] = Field(description="Document hierarchy used for determination")
     confidence: float = Field(description="Confidence in date determination")
     alternative_dates: List[Dict[str, Any]] = Field(
         default_factory=list,
@@ -83,7 +83,7 @@ class BorrowingEntity(BaseModel):
     
     # Validation
     entity_validation_score: float = Field(description="Overall entity validation score")
-    validation_flags: List[str] = Field(default_factory=list, description="Validation flags")
+    validation_flags: List[InternedStr] = Field(default_factory=list, description="Validation flags")
     
     def get_constitution_from_pan(self) -> str:
         """Determine constitution from PAN 4th character."""
@@ -135,7 +135,7 @@ class EntityProfile(BaseModel):
     )
     
     # Risk indicators
-    risk_indicators: List[str] = Field(
+    risk_indicators: List[InternedStr] = Field(
         default_factory=list,
         description="Risk indicators identified"
     )
@@ -1,10 +1,11 @@
 """Models for final report generation."""
 
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from pydantic import Field
 
-from .base import BaseModel
+from .base import BaseModel, InternedStr
+from .entity import BorrowingEntity
 
 
 class ExecutiveSummary(BaseModel):
@@ -44,6 +45,20 @@ class EntitySummary(BaseModel):
     registered_address: str = Field(description="Registered address")
     business_activity: Optional[str] = Field(default=None, description="Business activity")
     msm_classification: Optional[str] = Field(default=None, description="MSM classification")
+    
+    @classmethod
+    def from_borrowing_entity(cls, entity: BorrowingEntity) -> "EntitySummary":
+        """Build a summary from an already-validated entity without re-validating its fields."""
+        return cls.model_construct(
+            legal_name=entity.entity_name,
+            constitution=entity.constitution,
+            pan_number=entity.pan_number,
+            gst_number=entity.gst_number,
+            date_of_establishment=entity.date_of_establishment.determined_date,
+            registered_address=entity.registered_address.get_full_address(),
+            business_activity=entity.business_activity,
+            msm_classification=entity.msme_classification,
+        )
 
 
 class KMPSummary(BaseModel):
@@ -140,9 +155,9 @@ class RiskAssessmentSummary(BaseModel):
     risk_category: str = Field(description="Risk category")
     risk_grade: str = Field(description="Risk grade")
     
-    key_strengths: List[str] = Field(description="Key strengths")
-    areas_of_concern: List[str] = Field(description="Areas of concern")
-    recommended_mitigations: List[str] = Field(description="Recommended mitigations")
+    key_strengths: Tuple[str, ...] = Field(description="Key strengths")
+    areas_of_concern: Tuple[str, ...] = Field(description="Areas of concern")
+    recommended_mitigations: Tuple[str, ...] = Field(description="Recommended mitigations")
 
 
 class ProposedTerms(BaseModel):
@@ -167,11 +182,11 @@ class LoanRecommendation(BaseModel):
     confidence_level: str = Field(description="Confidence level")
     recommended_loan_amount: float = Field(description="Recommended loan amount")
     
-    suggested_conditions: List[str] = Field(description="Suggested conditions")
+    suggested_conditions: Tuple[str, ...] = Field(description="Suggested conditions")
     proposed_terms: ProposedTerms = Field(description="Proposed terms")
     
     estimated_processing_timeline: str = Field(description="Estimated processing timeline")
-    next_steps: List[str] = Field(description="Next steps")
+    next_steps: Tuple[str, ...] = Field(description="Next steps")
     
     # Risk mitigation
     risk_mitigation_measures: Optional[List[str]] = Field(
@@ -190,7 +205,7 @@ class ProcessingSummary(BaseModel):
     """Summary of processing workflow."""
     
     total_processing_time: float = Field(description="Total processing time in seconds")
-    agents_executed: List[str] = Field(description="List of agents executed")
+    agents_executed: Tuple[str, ...] = Field(description="List of agents executed")
     total_api_calls: int = Field(description="Total API calls made")
     total_api_cost: float = Field(description="Total API cost")
     
@@ -207,7 +222,7 @@ class QualityMetrics(BaseModel):
     cross_validation_score: float = Field(description="Cross-validation score")
     
     # Quality flags
-    quality_flags: List[str] = Field(default_factory=list, description="Quality flags")
+    quality_flags: List[InternedStr] = Field(default_factory=list, description="Quality flags")
     manual_review_required: bool = Field(description="Whether manual review is required")
 
 
@@ -248,8 +263,8 @@ class FinalReport(BaseModel):
     )
     
     # Warnings and disclaimers
-    warnings: List[str] = Field(default_factory=list, description="Warnings")
-    disclaimers: List[str] = Field(default_factory=list, description="Disclaimers")
+    warnings: List[InternedStr] = Field(default_factory=list, description="Warnings")
+    disclaimers: List[InternedStr] = Field(default_factory=list, description="Disclaimers")
     
     # Additional sections for comprehensive reporting
     market_analysis: Optional[Dict[str, Any]] = Field(default=None, description="Market analysis")
@@ -301,3 +316,10 @@ class FinalReport(BaseModel):
     def get_recommendation_summary(self) -> str:
         """Get a brief recommendation summary."""
         return f"{self.loan_recommendation.primary_recommendation} - {self.loan_recommendation.confidence_level}"
+
+
+# Pre-build the report schema at import so request paths never walk the model tree
+try:
+    FINAL_REPORT_SCHEMA: Optional[Dict[str, Any]] = FinalReport.json_schema_cached()
+except Exception:
+    FINAL_REPORT_SCHEMA = None
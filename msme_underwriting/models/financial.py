@@ -1,9 +1,89 @@
 """Models for financial analysis."""
 
-from typing import Dict, List, Optional, Any
+import math
+from enum import Enum
+from typing import Dict, List, Optional, Any, Tuple, cast
+
+import numpy as np
 from pydantic import Field
 
-from .base import BaseModel
+from .base import BaseModel, ValueModel
+
+
+class TurnoverAssessment(str, Enum):
+    """Turnover assessment relative to industry."""
+    
+    ABOVE_AVERAGE = "above_average"
+    AVERAGE = "average"
+    BELOW_AVERAGE = "below_average"
+
+
+class ProfitabilityTrend(str, Enum):
+    """Direction of profitability over time."""
+    
+    IMPROVING = "improving"
+    STABLE = "stable"
+    DECLINING = "declining"
+
+
+class IndustryComparison(str, Enum):
+    """Comparison against industry peers."""
+    
+    FAVORABLE = "favorable"
+    AVERAGE = "average"
+    UNFAVORABLE = "unfavorable"
+
+
+class LiquidityAssessment(str, Enum):
+    """Liquidity assessment level."""
+    
+    EXCELLENT = "excellent"
+    ADEQUATE = "adequate"
+    POOR = "poor"
+
+
+class LeverageAssessment(str, Enum):
+    """Leverage assessment level."""
+    
+    CONSERVATIVE = "conservative"
+    MANAGEABLE = "manageable"
+    AGGRESSIVE = "aggressive"
+
+
+class CashFlowStability(str, Enum):
+    """Cash flow stability level."""
+    
+    STABLE = "stable"
+    VOLATILE = "volatile"
+    DECLINING = "declining"
+
+
+class FinancialHealthLevel(str, Enum):
+    """Overall financial health level."""
+    
+    EXCELLENT = "excellent"
+    GOOD = "good"
+    FAIR = "fair"
+    POOR = "poor"
+
+
+class MonthlyTurnover(ValueModel):
+    """Turnover for a single month."""
+    
+    month: str = Field(description="Month (YYYY-MM)")
+    turnover: float = Field(description="Turnover for the month")
+
+
+class ProjectedCashFlow(ValueModel):
+    """Projected cash flow for a single year."""
+    
+    year: int = Field(description="Projection year")
+    amount: float = Field(description="Projected cash flow amount")
+    scenario: str = Field(default="base", description="Projection scenario (base/stress/optimistic)")
+
+
+# Columnar layout for projected cash flow analytics
+PROJECTED_CASH_FLOW_DTYPE = np.dtype([("year", np.int32), ("amount", np.float64), ("scenario", "U16")])
 
 
 class TurnoverAnalysis(BaseModel):
@@ -16,11 +96,11 @@ class TurnoverAnalysis(BaseModel):
     growth_rate: Optional[float] = Field(default=None, description="Year-over-year growth rate")
     cagr_3_year: Optional[float] = Field(default=None, description="3-year CAGR")
     industry_benchmark: Optional[float] = Field(default=None, description="Industry benchmark growth")
-    assessment: str = Field(description="Turnover assessment (above_average/average/below_average)")
+    assessment: TurnoverAssessment = Field(description="Turnover assessment (above_average/average/below_average)")
     
     # Seasonal analysis
     seasonal_patterns: Optional[Dict[str, Any]] = Field(default=None, description="Seasonal patterns")
-    monthly_breakdown: Optional[List[Dict[str, Any]]] = Field(default=None, description="Monthly breakdown")
+    monthly_breakdown: Optional[List[MonthlyTurnover]] = Field(default=None, description="Monthly breakdown")
     
     @property
     def shows_growth(self) -> bool:
@@ -35,9 +115,14 @@ class TurnoverAnalysis(BaseModel):
             self.industry_benchmark is not None and
             self.growth_rate > self.industry_benchmark
         )
+    
+    def monthly_turnover_array(self) -> np.ndarray:
+        """Get monthly turnover figures as a float64 array."""
+        months = self.monthly_breakdown or ()
+        return np.fromiter((month.turnover for month in months), dtype=np.float64, count=len(months))
 
 
-class ProfitabilityRatios(BaseModel):
+class ProfitabilityRatios(ValueModel):
     """Profitability ratio analysis."""
     
     # Margin ratios
@@ -53,8 +138,8 @@ class ProfitabilityRatios(BaseModel):
     return_on_capital_employed: Optional[float] = Field(default=None, description="Return on capital employed")
     
     # Trend analysis
-    trend: str = Field(description="Profitability trend (improving/stable/declining)")
-    industry_comparison: str = Field(description="Industry comparison (favorable/average/unfavorable)")
+    trend: ProfitabilityTrend = Field(description="Profitability trend (improving/stable/declining)")
+    industry_comparison: IndustryComparison = Field(description="Industry comparison (favorable/average/unfavorable)")
     
     # Benchmarking
     industry_benchmarks: Optional[Dict[str, float]] = Field(default=None, description="Industry benchmarks")
@@ -74,7 +159,7 @@ class ProfitabilityRatios(BaseModel):
         )
 
 
-class LiquidityRatios(BaseModel):
+class LiquidityRatios(ValueModel):
     """Liquidity ratio analysis."""
     
     current_ratio_2023: Optional[float] = Field(default=None, description="Current ratio 2023")
@@ -88,7 +173,7 @@ class LiquidityRatios(BaseModel):
     working_capital_cycle: Optional[int] = Field(default=None, description="Working capital cycle in days")
     
     # Assessment
-    assessment: str = Field(description="Liquidity assessment (excellent/adequate/poor)")
+    assessment: LiquidityAssessment = Field(description="Liquidity assessment (excellent/adequate/poor)")
     
     # Components
     current_assets: Optional[float] = Field(default=None, description="Current assets")
@@ -111,7 +196,7 @@ class LiquidityRatios(BaseModel):
         )
 
 
-class LeverageRatios(BaseModel):
+class LeverageRatios(ValueModel):
     """Leverage ratio analysis."""
     
     debt_equity_ratio_2023: Optional[float] = Field(default=None, description="Debt-to-equity ratio 2023")
@@ -126,7 +211,7 @@ class LeverageRatios(BaseModel):
     total_equity: Optional[float] = Field(default=None, description="Total equity")
     
     # Assessment
-    assessment: str = Field(description="Leverage assessment (conservative/manageable/aggressive)")
+    assessment: LeverageAssessment = Field(description="Leverage assessment (conservative/manageable/aggressive)")
     
     # Capacity analysis
     additional_debt_capacity: Optional[float] = Field(default=None, description="Additional debt capacity")
@@ -148,7 +233,7 @@ class LeverageRatios(BaseModel):
         return self.debt_service_coverage_ratio is not None and self.debt_service_coverage_ratio >= 1.5
 
 
-class CashFlowAnalysis(BaseModel):
+class CashFlowAnalysis(ValueModel):
     """Cash flow analysis results."""
     
     # Operating cash flow
@@ -168,11 +253,11 @@ class CashFlowAnalysis(BaseModel):
     free_cash_flow_yield: Optional[float] = Field(default=None, description="Free cash flow yield")
     
     # Stability assessment
-    cash_flow_stability: str = Field(description="Cash flow stability (stable/volatile/declining)")
+    cash_flow_stability: CashFlowStability = Field(description="Cash flow stability (stable/volatile/declining)")
     cash_conversion_cycle: Optional[int] = Field(default=None, description="Cash conversion cycle in days")
     
     # Projections
-    projected_cash_flows: Optional[List[Dict[str, Any]]] = Field(
+    projected_cash_flows: Optional[List[ProjectedCashFlow]] = Field(
         default=None, 
         description="Projected cash flows"
     )
@@ -186,6 +271,24 @@ class CashFlowAnalysis(BaseModel):
     def has_positive_free_cash_flow(self) -> bool:
         """Check if entity has positive free cash flow."""
         return self.free_cash_flow is not None and self.free_cash_flow > 0
+    
+    def projected_cash_flow_array(self) -> np.ndarray:
+        """Get projected cash flows as a structured (year, amount, scenario) array."""
+        projections = self.projected_cash_flows or ()
+        return np.fromiter(
+            ((p.year, p.amount, p.scenario) for p in projections),
+            dtype=PROJECTED_CASH_FLOW_DTYPE,
+            count=len(projections),
+        )
+    
+    def projected_npv(self, discount_rate: float, scenario: str = "base") -> float:
+        """Calculate the net present value of one scenario's projected cash flows."""
+        projections = self.projected_cash_flow_array()
+        projections = projections[projections["scenario"] == scenario]
+        if projections.size == 0:
+            return 0.0
+        periods = projections["year"] - projections["year"].min() + 1
+        return float(np.sum(projections["amount"] / (1 + discount_rate) ** periods))
 
 
 class LoanServicingCapacity(BaseModel):
@@ -232,6 +335,9 @@ class LoanServicingCapacity(BaseModel):
         return self.debt_service_coverage_ratio is not None and self.debt_service_coverage_ratio >= 1.25
 
 
+_HEALTHY_LEVELS = frozenset((FinancialHealthLevel.EXCELLENT.value, FinancialHealthLevel.GOOD.value))
+
+
 class FinancialHealthAssessment(BaseModel):
     """Complete financial health assessment."""
     
@@ -242,7 +348,7 @@ class FinancialHealthAssessment(BaseModel):
     cash_flow_analysis: CashFlowAnalysis = Field(description="Cash flow analysis")
     
     # Overall assessment
-    overall_financial_health: str = Field(description="Overall financial health (excellent/good/fair/poor)")
+    overall_financial_health: FinancialHealthLevel = Field(description="Overall financial health (excellent/good/fair/poor)")
     financial_strength_score: Optional[float] = Field(default=None, description="Financial strength score")
     
     # Key insights
@@ -280,10 +386,28 @@ class FinancialHealthAssessment(BaseModel):
         
         return sum(scores) / len(scores) if scores else 0.0
     
+    def composite_score_inputs(self) -> Tuple[float, float, float, float]:
+        """Get the raw composite-score inputs, with NaN for missing values."""
+        return (
+            _nan_if_none(self.profitability_ratios.net_profit_margin_2023),
+            _nan_if_none(self.liquidity_ratios.current_ratio_2023),
+            _nan_if_none(self.leverage_ratios.debt_equity_ratio_2023),
+            _nan_if_none(self.cash_flow_analysis.operating_cash_flow),
+        )
+    
     @property
     def is_financially_healthy(self) -> bool:
         """Check if entity is financially healthy."""
-        return self.overall_financial_health in ["excellent", "good"]
+        return self.overall_financial_health in _HEALTHY_LEVELS
+    
+    def lending_criteria_flags(self) -> Tuple[bool, bool, bool, bool]:
+        """Get the individual lending-criteria checks (profit, liquidity, leverage, cash flow)."""
+        return (
+            self.profitability_ratios.is_profitable,
+            self.liquidity_ratios.has_adequate_liquidity,
+            self.leverage_ratios.has_manageable_leverage,
+            self.cash_flow_analysis.generates_positive_operating_cash_flow,
+        )
     
     @property
     def meets_lending_criteria(self) -> bool:
@@ -294,3 +418,58 @@ class FinancialHealthAssessment(BaseModel):
             self.leverage_ratios.has_manageable_leverage and
             self.cash_flow_analysis.generates_positive_operating_cash_flow
         )
+
+
+def _nan_if_none(value: Optional[float]) -> float:
+    """Map a missing metric to NaN for array storage."""
+    return math.nan if value is None else value
+
+
+# Column order of composite-score input matrices
+COMPOSITE_SCORE_COLUMNS = (
+    "net_profit_margin_2023",
+    "current_ratio_2023",
+    "debt_equity_ratio_2023",
+    "operating_cash_flow",
+)
+
+
+def composite_scores_from_matrix(metrics: np.ndarray) -> np.ndarray:
+    """Score an (N, 4) matrix of raw inputs (NaN = missing), matching calculate_composite_score."""
+    metrics = np.asarray(metrics, dtype=np.float64)
+    scores = np.empty_like(metrics)
+    np.minimum(metrics[:, 0] * 10, 100, out=scores[:, 0])
+    np.minimum(metrics[:, 1] * 50, 100, out=scores[:, 1])
+    np.maximum(100 - metrics[:, 2] * 25, 0, out=scores[:, 2])
+    cash_flow = metrics[:, 3]
+    scores[:, 3] = np.where(cash_flow > 0, 100.0, 0.0)
+    scores[np.isnan(cash_flow), 3] = np.nan
+    
+    present = ~np.isnan(scores)
+    counts = present.sum(axis=1)
+    totals = np.where(present, scores, 0.0).sum(axis=1)
+    return cast(np.ndarray, np.divide(totals, counts, out=np.zeros_like(totals), where=counts > 0))
+
+
+def composite_score_matrix(assessments: List[FinancialHealthAssessment]) -> np.ndarray:
+    """Stack the raw composite-score inputs of many assessments into an (N, 4) matrix."""
+    return np.fromiter(
+        (assessment.composite_score_inputs() for assessment in assessments),
+        dtype=np.dtype((np.float64, len(COMPOSITE_SCORE_COLUMNS))),
+        count=len(assessments),
+    )
+
+
+def batch_composite_score(assessments: List[FinancialHealthAssessment]) -> np.ndarray:
+    """Calculate composite financial health scores for many assessments at once."""
+    return composite_scores_from_matrix(composite_score_matrix(assessments))
+
+
+def batch_meets_lending_criteria(assessments: List[FinancialHealthAssessment]) -> np.ndarray:
+    """Check basic lending criteria for many assessments, returning a boolean mask."""
+    flags = np.fromiter(
+        (assessment.lending_criteria_flags() for assessment in assessments),
+        dtype=np.dtype((np.bool_, 4)),
+        count=len(assessments),
+    )
+    return cast(np.ndarray, flags.all(axis=1))
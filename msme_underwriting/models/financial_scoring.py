@@ -0,0 +1,73 @@
+"""Compiled batch scoring for financial health assessments.
+
+Kept out of the models package imports so the Numba import and JIT compile are only
+paid by portfolio-scoring code paths that use them.
+"""
+
+from typing import List
+
+import numpy as np
+
+from .financial import (
+    COMPOSITE_SCORE_COLUMNS,
+    FinancialHealthAssessment,
+    composite_score_matrix,
+    composite_scores_from_matrix,
+)
+
+# Optional JIT compiler - fall back to the NumPy implementation if unavailable
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+
+if _HAVE_NUMBA:
+
+    @njit("float64[:](float64[:, :])", cache=True, parallel=True)
+    def _composite_scores_kernel(metrics: np.ndarray) -> np.ndarray:
+        """Score each row of [npm_2023, cr_2023, de_2023, ocf], skipping NaN inputs."""
+        n_rows = metrics.shape[0]
+        scores = np.empty(n_rows)
+        for i in prange(n_rows):
+            total = 0.0
+            count = 0
+
+            profit_margin = metrics[i, 0]
+            if not np.isnan(profit_margin):
+                total += min(profit_margin * 10.0, 100.0)
+                count += 1
+
+            current_ratio = metrics[i, 1]
+            if not np.isnan(current_ratio):
+                total += min(current_ratio * 50.0, 100.0)
+                count += 1
+
+            debt_equity = metrics[i, 2]
+            if not np.isnan(debt_equity):
+                total += max(100.0 - debt_equity * 25.0, 0.0)
+                count += 1
+
+            operating_cash_flow = metrics[i, 3]
+            if not np.isnan(operating_cash_flow):
+                total += 100.0 if operating_cash_flow > 0 else 0.0
+                count += 1
+
+            scores[i] = total / count if count > 0 else 0.0
+        return scores
+
+
+def batch_composite_raw(metrics: np.ndarray) -> np.ndarray:
+    """Score an (N, 4) raw-metrics matrix, using the compiled kernel when Numba is installed."""
+    metrics = np.ascontiguousarray(metrics, dtype=np.float64)
+    if metrics.ndim != 2 or metrics.shape[1] != len(COMPOSITE_SCORE_COLUMNS):
+        raise ValueError(f"Expected an (N, {len(COMPOSITE_SCORE_COLUMNS)}) metrics matrix")
+    if not _HAVE_NUMBA:
+        return composite_scores_from_matrix(metrics)
+    return _composite_scores_kernel(metrics)
+
+
+def score_portfolio(assessments: List[FinancialHealthAssessment]) -> np.ndarray:
+    """Calculate composite scores for a portfolio of assessments in one batch."""
+    return batch_composite_raw(composite_score_matrix(assessments))
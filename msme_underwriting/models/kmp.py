@@ -1,9 +1,21 @@
 """Models for Key Management Personnel (KMP) analysis."""
 
-from typing import Dict, List, Optional, Any
-from pydantic import Field
+from enum import Enum
+from typing import Dict, List, Optional, Any, Tuple
 
-from .base import BaseModel
+import numpy as np
+from pydantic import Field, PrivateAttr
+
+from .base import BaseModel, ValueModel
+
+
+class KYCCompleteness(str, Enum):
+    """KYC completeness status of a KMP."""
+    
+    COMPLETE = "complete"
+    PARTIAL = "partial"
+    INCOMPLETE = "incomplete"
+    NONE = "none"
 
 
 class ConstitutionRequirements(BaseModel):
@@ -13,14 +25,20 @@ class ConstitutionRequirements(BaseModel):
     minimum_partners_required: Optional[int] = Field(default=None, description="Minimum partners required")
     maximum_partners_allowed: Optional[int] = Field(default=None, description="Maximum partners allowed")
     minimum_coverage_required: float = Field(description="Minimum coverage percentage required")
-    required_documents: List[str] = Field(description="Required documents for this constitution")
-    
-    def get_coverage_requirement(self) -> float:
-        """Get the minimum coverage requirement."""
-        return self.minimum_coverage_required
+    required_documents: Tuple[str, ...] = Field(description="Required documents for this constitution")
+
+
+# Documents a KMP needs for complete KYC
+_KYC_REQUIRED_DOCUMENTS = ("pan_card", "aadhaar_card")
+
+# Per-KMP columns gathered in a single traversal for coverage reductions
+_COVERAGE_DTYPE = np.dtype([("share", np.float64), ("complete", np.bool_), ("has_docs", np.bool_)])
+
+# Per-analysis columns for batch portfolio risk scoring
+_RISK_DTYPE = np.dtype([("coverage", np.float64), ("avg_risk", np.float64), ("has_kmps", np.bool_)])
 
 
-class IdentifiedKMP(BaseModel):
+class IdentifiedKMP(ValueModel):
     """Information about an identified Key Management Personnel."""
     
     kmp_id: str = Field(description="Unique KMP identifier")
@@ -36,7 +54,7 @@ class IdentifiedKMP(BaseModel):
     partnership_share: Optional[float] = Field(default=None, description="Partnership share")
     
     # Document availability
-    documents_available: List[str] = Field(description="List of available documents")
+    documents_available: Tuple[str, ...] = Field(description="List of available documents")
     missing_documents: List[str] = Field(default_factory=list, description="List of missing documents")
     
     # API verification
@@ -49,7 +67,7 @@ class IdentifiedKMP(BaseModel):
     email: Optional[str] = Field(default=None, description="Email address")
     
     # KYC status
-    kyc_completeness: str = Field(description="KYC completeness status")
+    kyc_completeness: KYCCompleteness = Field(description="KYC completeness status")
     kyc_score: Optional[float] = Field(default=None, description="KYC completeness score")
     
     # Risk assessment
@@ -63,7 +81,7 @@ class IdentifiedKMP(BaseModel):
     @property
     def has_complete_kyc(self) -> bool:
         """Check if KMP has complete KYC."""
-        return self.kyc_completeness == "complete"
+        return self.kyc_completeness == KYCCompleteness.COMPLETE
     
     @property
     def effective_share(self) -> float:
@@ -72,9 +90,19 @@ class IdentifiedKMP(BaseModel):
     
     def get_missing_documents_for_kyc(self) -> List[str]:
         """Get documents missing for complete KYC."""
-        required_docs = ["pan_card", "aadhaar_card"]
-        available_docs = [doc.lower() for doc in self.documents_available]
-        return [doc for doc in required_docs if doc not in available_docs]
+        available_docs = frozenset(doc.lower() for doc in self.documents_available)
+        return [doc for doc in _KYC_REQUIRED_DOCUMENTS if doc not in available_docs]
+
+
+class MissingRequirement(ValueModel):
+    """A KMP documentation requirement that is still outstanding."""
+    
+    requirement_type: str = Field(description="Type of requirement (e.g., kmp_kyc)")
+    missing_for: str = Field(description="KMP or entity the requirement is missing for")
+    required_documents: List[str] = Field(description="Documents required to satisfy it")
+    shareholding_impact: float = Field(description="Shareholding percentage affected")
+    mandatory: bool = Field(description="Whether the requirement is mandatory")
+    business_justification: str = Field(description="Business justification for the requirement")
 
 
 class KMPCoverageAnalysis(BaseModel):
@@ -97,24 +125,63 @@ class KMPCoverageAnalysis(BaseModel):
     
     def calculate_coverage_metrics(self, kmps: List[IdentifiedKMP]) -> None:
         """Calculate coverage metrics from KMP list."""
-        total_share = sum(kmp.effective_share for kmp in kmps)
-        complete_kyc_share = sum(
-            kmp.effective_share for kmp in kmps if kmp.has_complete_kyc
+        columns = np.fromiter(
+            (
+                (kmp.effective_share, kmp.has_complete_kyc, len(kmp.documents_available) > 0)
+                for kmp in kmps
+            ),
+            dtype=_COVERAGE_DTYPE,
+            count=len(kmps),
         )
+        shares = columns["share"]
+        complete = columns["complete"]
+        has_docs = columns["has_docs"]
+        
+        total_share = float(shares.sum())
+        complete_kyc_share = float(shares[complete].sum())
         
         self.total_shareholding_covered = total_share
         self.coverage_percentage = complete_kyc_share / 100.0 if total_share > 0 else 0.0
         
         # Update counts
-        self.partners_with_complete_kyc = sum(1 for kmp in kmps if kmp.has_complete_kyc)
-        self.partners_with_partial_kyc = sum(
-            1 for kmp in kmps 
-            if not kmp.has_complete_kyc and len(kmp.documents_available) > 0
-        )
-        self.partners_with_no_kyc = sum(
-            1 for kmp in kmps 
-            if len(kmp.documents_available) == 0
-        )
+        self.partners_with_complete_kyc = int(complete.sum())
+        self.partners_with_partial_kyc = int((~complete & has_docs).sum())
+        self.partners_with_no_kyc = int((~has_docs).sum())
+
+
+class _KMPIndex:
+    """Lookup indexes and risk totals over one identified_kmps list."""
+    
+    __slots__ = ("kmps", "size", "by_id", "by_role", "complete_kyc", "missing_docs", "risk_sum", "risk_count")
+    
+    def __init__(self, kmps: List[IdentifiedKMP]) -> None:
+        self.kmps = kmps
+        self.size = 0
+        self.by_id: Dict[str, IdentifiedKMP] = {}
+        self.by_role: Dict[str, List[IdentifiedKMP]] = {}
+        self.complete_kyc: List[IdentifiedKMP] = []
+        self.missing_docs: List[IdentifiedKMP] = []
+        self.risk_sum = 0.0
+        self.risk_count = 0
+        for kmp in kmps:
+            self.add(kmp)
+    
+    def covers(self, kmps: List[IdentifiedKMP]) -> bool:
+        """Whether the index was built over this list and has seen all of its items."""
+        return self.kmps is kmps and self.size == len(kmps)
+    
+    def add(self, kmp: IdentifiedKMP) -> None:
+        """Index one more KMP from the list."""
+        self.size += 1
+        self.by_id.setdefault(kmp.kmp_id, kmp)
+        self.by_role.setdefault(kmp.role.lower(), []).append(kmp)
+        if kmp.has_complete_kyc:
+            self.complete_kyc.append(kmp)
+        if kmp.missing_documents:
+            self.missing_docs.append(kmp)
+        if kmp.risk_score is not None:
+            self.risk_sum += kmp.risk_score
+            self.risk_count += 1
 
 
 class KMPAnalysis(BaseModel):
@@ -133,48 +200,61 @@ class KMPAnalysis(BaseModel):
     )
     
     # Missing requirements
-    missing_requirements: List[Dict[str, Any]] = Field(
+    missing_requirements: List[MissingRequirement] = Field(
         default_factory=list,
         description="Missing KMP requirements"
     )
     
     # Data sources used
-    data_sources_used: List[str] = Field(
-        default_factory=list,
+    data_sources_used: Tuple[str, ...] = Field(
+        default=(),
         description="Data sources used for KMP identification"
     )
     
+    # Lookup indexes over identified_kmps, rebuilt on read if the list was replaced or resized
+    _index: Optional[_KMPIndex] = PrivateAttr(default=None)
+    
+    def _kmp_index(self) -> _KMPIndex:
+        """Get the lookup indexes for the current KMP list, rebuilding them if stale."""
+        index = self._index
+        if index is None or not index.covers(self.identified_kmps):
+            index = self._index = _KMPIndex(self.identified_kmps)
+        return index
+    
+    def add_kmp(self, kmp: IdentifiedKMP) -> None:
+        """Add an identified KMP, keeping the lookup indexes in sync."""
+        index = self._kmp_index()
+        self.identified_kmps.append(kmp)
+        index.add(kmp)
+    
     def get_kmp_by_id(self, kmp_id: str) -> Optional[IdentifiedKMP]:
         """Get KMP by ID."""
-        for kmp in self.identified_kmps:
-            if kmp.kmp_id == kmp_id:
-                return kmp
-        return None
+        return self._kmp_index().by_id.get(kmp_id)
     
     def get_kmps_by_role(self, role: str) -> List[IdentifiedKMP]:
         """Get KMPs by role."""
-        return [kmp for kmp in self.identified_kmps if kmp.role.lower() == role.lower()]
+        return list(self._kmp_index().by_role.get(role.lower(), ()))
     
     def get_kmps_with_complete_kyc(self) -> List[IdentifiedKMP]:
         """Get KMPs with complete KYC."""
-        return [kmp for kmp in self.identified_kmps if kmp.has_complete_kyc]
+        return list(self._kmp_index().complete_kyc)
     
     def get_kmps_missing_documents(self) -> List[IdentifiedKMP]:
         """Get KMPs with missing documents."""
-        return [kmp for kmp in self.identified_kmps if len(kmp.missing_documents) > 0]
+        return list(self._kmp_index().missing_docs)
     
     def add_missing_requirement(self, requirement_type: str, missing_for: str, 
                               required_documents: List[str], shareholding_impact: float,
                               mandatory: bool, business_justification: str) -> None:
         """Add a missing requirement."""
-        requirement = {
-            "requirement_type": requirement_type,
-            "missing_for": missing_for,
-            "required_documents": required_documents,
-            "shareholding_impact": shareholding_impact,
-            "mandatory": mandatory,
-            "business_justification": business_justification
-        }
+        requirement = MissingRequirement(
+            requirement_type=requirement_type,
+            missing_for=missing_for,
+            required_documents=required_documents,
+            shareholding_impact=shareholding_impact,
+            mandatory=mandatory,
+            business_justification=business_justification,
+        )
         self.missing_requirements.append(requirement)
     
     @property
@@ -192,23 +272,37 @@ class KMPAnalysis(BaseModel):
         """Get coverage percentage."""
         return self.kmp_coverage_analysis.coverage_percentage
     
+    @property
+    def average_individual_risk(self) -> float:
+        """Get the mean individual KMP risk score (0.5 if none are scored)."""
+        index = self._kmp_index()
+        return index.risk_sum / index.risk_count if index.risk_count else 0.5
+    
     def calculate_risk_score(self) -> float:
         """Calculate overall KMP risk score."""
         if not self.identified_kmps:
             return 1.0  # High risk if no KMPs identified
         
-        # Calculate based on coverage and individual risk scores
-        coverage_score = self.coverage_percentage
-        individual_risk_scores = [
-            kmp.risk_score for kmp in self.identified_kmps 
-            if kmp.risk_score is not None
-        ]
-        
-        if individual_risk_scores:
-            avg_individual_risk = sum(individual_risk_scores) / len(individual_risk_scores)
-        else:
-            avg_individual_risk = 0.5  # Neutral if no individual scores
-        
         # Combine coverage and individual risk (weighted)
-        overall_risk = (1 - coverage_score) * 0.6 + avg_individual_risk * 0.4
+        coverage = self.kmp_coverage_analysis.coverage_percentage
+        overall_risk = (1 - coverage) * 0.6 + self.average_individual_risk * 0.4
         return min(max(overall_risk, 0.0), 1.0)  # Clamp between 0 and 1
+
+
+def batch_kmp_risk(analyses: List[KMPAnalysis]) -> np.ndarray:
+    """Calculate overall KMP risk scores for many analyses at once."""
+    columns = np.fromiter(
+        (
+            (
+                analysis.kmp_coverage_analysis.coverage_percentage,
+                analysis.average_individual_risk,
+                bool(analysis.identified_kmps),
+            )
+            for analysis in analyses
+        ),
+        dtype=_RISK_DTYPE,
+        count=len(analyses),
+    )
+    risk = np.clip((1 - columns["coverage"]) * 0.6 + columns["avg_risk"] * 0.4, 0.0, 1.0)
+    risk[~columns["has_kmps"]] = 1.0  # High risk if no KMPs identified
+    return risk
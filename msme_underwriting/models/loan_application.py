@@ -1,34 +1,73 @@
 """Models for loan application data."""
 
+import hashlib
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional
-from pydantic import Field
+from typing import BinaryIO, List, Optional
 
-from .base import BaseModel, TimestampedModel
+import numpy as np
+from pydantic import Field, PrivateAttr
 
+from .base import TimestampedModel, ValueModel, EpochNs, InternedStr, from_epoch_ns
 
-class LoanContext(BaseModel):
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _sha256_file(file_obj: BinaryIO) -> str:
+    """Hash a binary file object with SHA-256, streaming it in chunks."""
+    if sys.version_info >= (3, 11):
+        return hashlib.file_digest(file_obj, "sha256").hexdigest()
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: file_obj.read(_HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+class LoanContext(ValueModel):
     """Context information about the loan application."""
     
     loan_type: str = Field(description="Type of loan (e.g., MSM_supply_chain)")
     loan_amount: int = Field(description="Requested loan amount")
-    application_timestamp: datetime = Field(description="When the application was submitted")
+    application_timestamp: EpochNs = Field(description="When the application was submitted (epoch ns)")
     purpose: Optional[str] = Field(default=None, description="Purpose of the loan")
     tenure_months: Optional[int] = Field(default=None, description="Requested tenure in months")
+    
+    @property
+    def application_timestamp_dt(self) -> datetime:
+        """Get the submission time as a naive UTC datetime."""
+        return from_epoch_ns(self.application_timestamp)
 
 
-class UploadedFile(BaseModel):
+class UploadedFile(ValueModel):
     """Information about an uploaded file."""
     
     file_name: str = Field(description="Name of the uploaded file")
     file_path: str = Field(description="Path to the uploaded file")
     file_size: int = Field(description="Size of the file in bytes")
-    upload_timestamp: datetime = Field(description="When the file was uploaded")
+    upload_timestamp: EpochNs = Field(description="When the file was uploaded (epoch ns)")
     file_type: str = Field(description="MIME type of the file")
     checksum: Optional[str] = Field(default=None, description="File checksum for integrity")
+    
+    @property
+    def upload_timestamp_dt(self) -> datetime:
+        """Get the upload time as a naive UTC datetime."""
+        return from_epoch_ns(self.upload_timestamp)
+    
+    def verify_checksum(self) -> bool:
+        """Check the file on disk against its stored SHA-256 checksum."""
+        if not self.checksum:
+            return False
+        try:
+            with open(self.file_path, "rb") as file_obj:
+                return _sha256_file(file_obj) == self.checksum.lower()
+        except OSError:
+            return False
 
 
-class ProcessingOptions(BaseModel):
+class ProcessingOptions(ValueModel):
     """Options for document processing."""
     
     max_pages_per_document: int = Field(default=50, description="Maximum pages to process per document")
@@ -49,35 +88,82 @@ class LoanApplication(TimestampedModel):
     processing_options: ProcessingOptions = Field(description="Processing options")
     
     # Application status tracking
-    current_step: str = Field(default="start", description="Current processing step")
-    status: str = Field(default="submitted", description="Application status")
-    priority: str = Field(default="normal", description="Processing priority")
+    current_step: InternedStr = Field(default="start", description="Current processing step")
+    status: InternedStr = Field(default="submitted", description="Application status")
+    priority: InternedStr = Field(default="normal", description="Processing priority")
     
     # Metadata
     source: str = Field(default="web", description="Application source")
     ip_address: Optional[str] = Field(default=None, description="Client IP address")
     user_agent: Optional[str] = Field(default=None, description="Client user agent")
     
+    # File-size total over the list it was summed from; a read adds any files appended
+    # since, and starts over if uploaded_files was replaced or shrank
+    _total_file_size: int = PrivateAttr(default=0)
+    _sized_files: Optional[List[UploadedFile]] = PrivateAttr(default=None)
+    _sized_count: int = PrivateAttr(default=0)
+    
     def update_step(self, step: str) -> None:
         """Update the current processing step."""
-        self.current_step = step
+        self._set_trusted("current_step", sys.intern(step))
         self.update_timestamp()
     
     def update_status(self, status: str) -> None:
         """Update the application status."""
-        self.status = status
+        self._set_trusted("status", sys.intern(status))
+        self.update_timestamp()
+    
+    def add_uploaded_file(self, uploaded_file: UploadedFile) -> None:
+        """Add an uploaded file."""
+        self.uploaded_files.append(uploaded_file)
         self.update_timestamp()
     
+    @property
+    def file_sizes(self) -> np.ndarray:
+        """Get uploaded file sizes as a contiguous int64 array."""
+        return np.fromiter(
+            (file.file_size for file in self.uploaded_files),
+            dtype=np.int64,
+            count=len(self.uploaded_files),
+        )
+    
     @property
     def total_file_size(self) -> int:
         """Calculate total size of all uploaded files."""
-        return sum(file.file_size for file in self.uploaded_files)
+        files = self.uploaded_files
+        if self._sized_files is not files or self._sized_count > len(files):
+            self._sized_files = files
+            self._sized_count = 0
+            self._total_file_size = 0
+        total = self._total_file_size
+        for position in range(self._sized_count, len(files)):
+            total += files[position].file_size
+        self._total_file_size = total
+        self._sized_count = len(files)
+        return total
     
     @property
     def file_count(self) -> int:
         """Get the number of uploaded files."""
         return len(self.uploaded_files)
     
+    def verify_file_integrity(self) -> List[bool]:
+        """Verify every uploaded file's checksum, hashing files concurrently."""
+        if not self.uploaded_files:
+            return []
+        max_workers = min(len(self.uploaded_files), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(UploadedFile.verify_checksum, self.uploaded_files))
+    
     def get_files_by_type(self, file_type: str) -> List[UploadedFile]:
         """Get files filtered by MIME type."""
         return [file for file in self.uploaded_files if file.file_type == file_type]
+
+
+def application_timestamps(applications: List[LoanApplication]) -> np.ndarray:
+    """Get submission times of many applications as a datetime64[ns] array for vectorized filtering."""
+    return np.fromiter(
+        (application.loan_context.application_timestamp for application in applications),
+        dtype=np.int64,
+        count=len(applications),
+    ).view("datetime64[ns]")
@@ -1,11 +1,13 @@
 """State models for LangGraph workflow."""
 
+import sys
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Literal, TypedDict
-from pydantic import Field
-from langgraph.graph import MessagesState
+from itertools import chain
+from typing import Annotated, Dict, Iterable, List, Optional, Any, Sequence, Tuple, Union
+from langgraph.channels.delta import DeltaChannel
+from pydantic import AliasChoices, ConfigDict, Field, SkipValidation, model_validator
 
-from .base import BaseModel, ProcessingMetadata, RoutingDecision
+from .base import AppendOnlyList, BaseModel, InternedStr, ValueModel, ProcessingMetadata, RoutingDecision
 from .loan_application import LoanApplication
 from .documents import ClassifiedDocuments, DocumentAnalysis, MissingDocument, ValidationWarning
 from .entity import EntityProfile
@@ -14,9 +16,17 @@ from .verification import BureauVerificationResults, EnhancedGSTAnalysis, Policy
 from .financial import FinancialHealthAssessment, LoanServicingCapacity
 from .banking import BankingAssessment
 from .final_report import FinalReport
+from .state_typeddicts import (
+    BankingIntegrationAnalysis,
+    BasicGroupIdentification,
+    CrossValidationResults,
+    GSTFinancialReconciliation,
+    PANValidation,
+    RiskAssessmentEnhancement,
+)
 
 
-class AgentContext(BaseModel):
+class AgentContext(ValueModel):
     """Context information for agent execution."""
     
     previous_agent: Optional[str] = Field(default=None, description="Name of the previous agent")
@@ -26,6 +36,104 @@ class AgentContext(BaseModel):
     timeout_seconds: int = Field(default=300, description="Timeout for this agent")
 
 
+class EventLog(BaseModel):
+    """Column-oriented log of agent errors or warnings (one list per attribute)."""
+    
+    agents: AppendOnlyList[str] = Field(default=(), description="Agent that logged each event")
+    messages: AppendOnlyList[str] = Field(default=(), description="Message for each event")
+    timestamps: AppendOnlyList[datetime] = Field(default=(), description="When each event was logged")
+    details: AppendOnlyList[Optional[Dict[str, Any]]] = Field(default=(), description="Optional details for each event")
+    
+    @model_validator(mode="before")
+    @classmethod
+    def _from_records(cls, data: Any) -> Any:
+        """Accept the legacy list-of-dicts form and split it into columns."""
+        if not isinstance(data, list):
+            return data
+        columns: Dict[str, List[Any]] = {"agents": [], "messages": [], "timestamps": [], "details": []}
+        for record in data:
+            columns["agents"].append(record.get("agent"))
+            columns["messages"].append(record.get("error", record.get("warning", record.get("message"))))
+            columns["timestamps"].append(record.get("timestamp"))
+            columns["details"].append(record.get("details") or None)
+        return columns
+    
+    @classmethod
+    def single(
+        cls, agent: str, message: str, timestamp: datetime, details: Optional[Dict[str, Any]] = None
+    ) -> "EventLog":
+        """Build a one-event log, e.g. as a node's error_log update."""
+        return cls(agents=[agent], messages=[message], timestamps=[timestamp], details=[details])
+    
+    def append(
+        self, agent: str, message: str, timestamp: datetime, details: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Append an event to each column."""
+        self._writable_list("agents").append(agent)
+        self._writable_list("messages").append(message)
+        self._writable_list("timestamps").append(timestamp)
+        self._writable_list("details").append(details)
+    
+    def extend(
+        self, rows: Iterable[Tuple[str, str, Optional[Dict[str, Any]]]], timestamp: datetime
+    ) -> None:
+        """Append (agent, message, details) rows that share one timestamp."""
+        rows = list(rows)
+        if not rows:
+            return
+        agents, messages, details = zip(*rows)
+        self._writable_list("agents").extend(agents)
+        self._writable_list("messages").extend(messages)
+        self._writable_list("timestamps").extend([timestamp] * len(rows))
+        self._writable_list("details").extend(details)
+    
+    def records(self, message_key: str) -> List[Dict[str, Any]]:
+        """Get the events as per-event dicts, with the message stored under message_key."""
+        return [
+            {"agent": agent, message_key: message, "timestamp": timestamp, "details": details or {}}
+            for agent, message, timestamp, details in zip(
+                self.agents, self.messages, self.timestamps, self.details
+            )
+        ]
+    
+    def __len__(self) -> int:
+        return len(self.agents)
+
+
+# LangGraph channel reducers: nodes return deltas for these fields, and writes from
+# parallel branches in the same step are combined instead of colliding
+
+def _concat_batches(left: Sequence[Any], writes: Sequence[Sequence[Any]]) -> List[Any]:
+    """Append a batch of newly written item lists to the accumulated sequence."""
+    return [*left, *chain.from_iterable(writes)]
+
+
+def _merge(left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge newly written keys into the accumulated mapping."""
+    return {**left, **right}
+
+
+def _latest(left: Any, right: Any) -> Any:
+    """Keep the most recent write."""
+    return right
+
+
+def _merge_event_logs(left: Any, right: Any) -> EventLog:
+    """Concatenate two event logs column by column."""
+    left_log = EventLog.model_validate(left)
+    right_log = EventLog.model_validate(right)
+    if not right_log.agents:
+        return left_log
+    if not left_log.agents:
+        return right_log
+    return EventLog(
+        agents=[*left_log.agents, *right_log.agents],
+        messages=[*left_log.messages, *right_log.messages],
+        timestamps=[*left_log.timestamps, *right_log.timestamps],
+        details=[*left_log.details, *right_log.details],
+    )
+
+
 class MSMELoanState(BaseModel):
     """
     Complete state for MSME loan processing workflow.
@@ -34,13 +142,18 @@ class MSMELoanState(BaseModel):
     all the data needed for loan processing decisions.
     """
     
+    model_config = ConfigDict(
+        # Build the (large) core schema on first use rather than at import time
+        defer_build=True,
+    )
+    
     # Core application data
     thread_id: str = Field(description="Unique thread ID for this loan application")
     loan_application: LoanApplication = Field(description="Original loan application data")
-    current_step: str = Field(default="start", description="Current processing step")
+    current_step: Annotated[str, _latest] = Field(default="start", description="Current processing step")
     
     # Agent context
-    agent_context: Optional[AgentContext] = Field(default=None, description="Current agent context")
+    agent_context: Annotated[Optional[AgentContext], _latest] = Field(default=None, description="Current agent context")
     
     # Processing results from each agent
     agent_results: Dict[str, Any] = Field(default_factory=dict, description="Results from each agent")
@@ -54,13 +167,17 @@ class MSMELoanState(BaseModel):
         default=None,
         description="Analysis of document processing"
     )
-    missing_documents: List[MissingDocument] = Field(
-        default_factory=list,
-        description="List of missing required documents"
+    missing_documents: AppendOnlyList[MissingDocument] = Field(
+        default=(),
+        description="List of missing required documents (append with add_missing_document)"
+    )
+    validation_warnings: AppendOnlyList[ValidationWarning] = Field(
+        default=(),
+        description="Document validation warnings (append with add_validation_warning)"
     )
-    validation_warnings: List[ValidationWarning] = Field(
-        default_factory=list,
-        description="Document validation warnings"
+    has_banking_documents: bool = Field(
+        default=False,
+        description="Whether banking documents were classified (flat flag for routing)"
     )
     
     # Agent 2: Entity & KMP Results
@@ -72,11 +189,11 @@ class MSMELoanState(BaseModel):
         default=None,
         description="KMP identification and analysis"
     )
-    basic_group_identification: Optional[Dict[str, Any]] = Field(
+    basic_group_identification: SkipValidation[Optional[BasicGroupIdentification]] = Field(
         default=None,
         description="Basic group company identification"
     )
-    cross_validation_results: Optional[Dict[str, Any]] = Field(
+    cross_validation_results: SkipValidation[Optional[CrossValidationResults]] = Field(
         default=None,
         description="Cross-validation results across documents"
     )
@@ -90,7 +207,7 @@ class MSMELoanState(BaseModel):
         default=None,
         description="Enhanced GST analysis results"
     )
-    pan_validation: Optional[Dict[str, Any]] = Field(
+    pan_validation: SkipValidation[Optional[PANValidation]] = Field(
         default=None,
         description="PAN validation results"
     )
@@ -112,11 +229,11 @@ class MSMELoanState(BaseModel):
         default=None,
         description="Financial health assessment"
     )
-    banking_integration_analysis: Optional[Dict[str, Any]] = Field(
+    banking_integration_analysis: SkipValidation[Optional[BankingIntegrationAnalysis]] = Field(
         default=None,
         description="Banking integration analysis"
     )
-    gst_financial_reconciliation: Optional[Dict[str, Any]] = Field(
+    gst_financial_reconciliation: SkipValidation[Optional[GSTFinancialReconciliation]] = Field(
         default=None,
         description="GST-Financial reconciliation"
     )
@@ -124,7 +241,7 @@ class MSMELoanState(BaseModel):
         default=None,
         description="Loan servicing capacity analysis"
     )
-    risk_assessment_enhancement: Optional[Dict[str, Any]] = Field(
+    risk_assessment_enhancement: SkipValidation[Optional[RiskAssessmentEnhancement]] = Field(
         default=None,
         description="Enhanced risk assessment from financial analysis"
     )
@@ -156,28 +273,31 @@ class MSMELoanState(BaseModel):
     )
     
     # Workflow control
-    processing_metadata: Dict[str, ProcessingMetadata] = Field(
+    processing_metadata: Annotated[Dict[str, ProcessingMetadata], _merge] = Field(
         default_factory=dict,
         description="Processing metadata for each agent"
     )
-    routing_decisions: List[RoutingDecision] = Field(
-        default_factory=list,
+    # Checkpoints store only the appended decisions; the history is replayed on restore
+    routing_decisions: Annotated[AppendOnlyList[RoutingDecision], DeltaChannel(_concat_batches)] = Field(
+        default=(),
         description="History of routing decisions"
     )
     
     # Error handling
-    errors: List[Dict[str, Any]] = Field(
-        default_factory=list,
-        description="List of errors encountered during processing"
+    error_log: Annotated[EventLog, _merge_event_logs] = Field(
+        default_factory=EventLog,
+        validation_alias=AliasChoices("error_log", "errors"),
+        description="Errors encountered during processing"
     )
-    warnings: List[Dict[str, Any]] = Field(
-        default_factory=list,
-        description="List of warnings encountered during processing"
+    warning_log: Annotated[EventLog, _merge_event_logs] = Field(
+        default_factory=EventLog,
+        validation_alias=AliasChoices("warning_log", "warnings"),
+        description="Warnings encountered during processing"
     )
     
     # Status tracking
-    workflow_status: str = Field(default="in_progress", description="Overall workflow status")
-    last_updated: datetime = Field(default_factory=datetime.utcnow, description="Last update timestamp")
+    workflow_status: InternedStr = Field(default="in_progress", description="Overall workflow status")
+    last_updated: Annotated[datetime, _latest] = Field(default_factory=datetime.utcnow, description="Last update timestamp")
     
     # Configuration
     business_rules: Dict[str, Any] = Field(
@@ -185,61 +305,72 @@ class MSMELoanState(BaseModel):
         description="Business rules and thresholds"
     )
     
+    def to_checkpoint(self) -> bytes:
+        """Serialize the full workflow state to JSON bytes for checkpointing."""
+        return self.__pydantic_serializer__.to_json(self, warnings=False)
+    
+    @classmethod
+    def from_checkpoint(cls, data: Union[bytes, str]) -> "MSMELoanState":
+        """Restore a workflow state from to_checkpoint() output in a single parse-and-validate pass."""
+        return cls.model_validate_json(data)
+    
     def update_step(self, step: str) -> None:
         """Update the current processing step."""
-        self.current_step = step
-        self.last_updated = datetime.utcnow()
+        self._set_trusted("current_step", sys.intern(step))
+        self._set_trusted("last_updated", datetime.utcnow())
     
     def add_agent_result(self, agent_name: str, result: Any) -> None:
         """Add result from an agent."""
         self.agent_results[agent_name] = result
-        self.last_updated = datetime.utcnow()
-    
-    def add_processing_metadata(self, agent_name: str, metadata: ProcessingMetadata) -> None:
-        """Add processing metadata for an agent."""
-        self.processing_metadata[agent_name] = metadata
-        self.last_updated = datetime.utcnow()
-    
-    def add_routing_decision(self, decision: RoutingDecision) -> None:
-        """Add a routing decision."""
-        self.routing_decisions.append(decision)
-        self.last_updated = datetime.utcnow()
+        self._set_trusted("last_updated", datetime.utcnow())
     
     def add_error(self, agent_name: str, error: str, details: Optional[Dict[str, Any]] = None) -> None:
         """Add an error."""
-        error_entry = {
-            "agent": agent_name,
-            "error": error,
-            "timestamp": datetime.utcnow(),
-            "details": details or {}
-        }
-        self.errors.append(error_entry)
-        self.last_updated = datetime.utcnow()
+        now = datetime.utcnow()
+        self.error_log.append(agent_name, error, now, details)
+        self._set_trusted("last_updated", now)
     
     def add_warning(self, agent_name: str, warning: str, details: Optional[Dict[str, Any]] = None) -> None:
         """Add a warning."""
-        warning_entry = {
-            "agent": agent_name,
-            "warning": warning,
-            "timestamp": datetime.utcnow(),
-            "details": details or {}
-        }
-        self.warnings.append(warning_entry)
-        self.last_updated = datetime.utcnow()
+        now = datetime.utcnow()
+        self.warning_log.append(agent_name, warning, now, details)
+        self._set_trusted("last_updated", now)
     
+    def extend_errors(self, rows: Iterable[Tuple[str, str, Optional[Dict[str, Any]]]]) -> None:
+        """Add several (agent, error, details) errors sharing one timestamp."""
+        rows = list(rows)
+        if rows:
+            now = datetime.utcnow()
+            self.error_log.extend(rows, now)
+            self._set_trusted("last_updated", now)
+    
+    def extend_warnings(self, rows: Iterable[Tuple[str, str, Optional[Dict[str, Any]]]]) -> None:
+        """Add several (agent, warning, details) warnings sharing one timestamp."""
+        rows = list(rows)
+        if rows:
+            now = datetime.utcnow()
+            self.warning_log.extend(rows, now)
+            self._set_trusted("last_updated", now)
+    
+    def add_missing_document(self, document: MissingDocument) -> None:
+        """Add a missing required document."""
+        self._writable_list("missing_documents").append(document)
+        self._set_trusted("last_updated", datetime.utcnow())
+    
+    def add_validation_warning(self, warning: ValidationWarning) -> None:
+        """Add a document validation warning."""
+        self._writable_list("validation_warnings").append(warning)
+        self._set_trusted("last_updated", datetime.utcnow())
+    
+    # Summed on each call: processing_metadata is a small per-agent dict that nodes
+    # replace through the reducer and callers may edit in place, so a cache goes stale
     def get_total_processing_time(self) -> float:
         """Get total processing time across all agents."""
-        return sum(
-            metadata.total_processing_time 
-            for metadata in self.processing_metadata.values()
-        )
+        return sum((metadata.total_processing_time for metadata in self.processing_metadata.values()), 0.0)
     
     def get_total_api_cost(self) -> float:
         """Get total API cost across all agents."""
-        return sum(
-            metadata.total_api_cost 
-            for metadata in self.processing_metadata.values()
-        )
+        return sum((metadata.total_api_cost for metadata in self.processing_metadata.values()), 0.0)
     
     
     @property
@@ -247,12 +378,22 @@ class MSMELoanState(BaseModel):
         """Get the number of agents that have processed this application."""
         return len(self.processing_metadata)
     
+    @property
+    def errors(self) -> Tuple[Dict[str, Any], ...]:
+        """Get errors as read-only per-event dicts; record new ones with add_error or extend_errors."""
+        return tuple(self.error_log.records("error"))
+    
+    @property
+    def warnings(self) -> Tuple[Dict[str, Any], ...]:
+        """Get warnings as read-only per-event dicts; record new ones with add_warning or extend_warnings."""
+        return tuple(self.warning_log.records("warning"))
+    
     @property
     def has_errors(self) -> bool:
         """Check if there are any errors."""
-        return len(self.errors) > 0
+        return len(self.error_log.agents) > 0
     
     @property
     def has_warnings(self) -> bool:
         """Check if there are any warnings."""
-        return len(self.warnings) > 0
+        return len(self.warning_log.agents) > 0
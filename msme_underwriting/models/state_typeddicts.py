@@ -0,0 +1,116 @@
+"""Typed shapes for the free-form analysis dicts carried on the workflow state.
+
+These document the keys agents are expected to produce. They are attached to
+MSMELoanState with SkipValidation, so the dicts are stored as handed over and
+are only checked by the producing agent.
+"""
+
+from typing import List
+
+from pydantic import ConfigDict, with_config
+from typing_extensions import TypedDict
+
+_ALLOW_EXTRA = ConfigDict(extra="allow")
+
+
+@with_config(_ALLOW_EXTRA)
+class RelatedEntity(TypedDict, total=False):
+    """Entity related to the borrower through a KMP."""
+    
+    entity_name: str
+    relation_type: str
+    related_kmp: str
+    kmp_role: str
+    source_document: str
+    income_source: str
+    confidence_level: str
+
+
+@with_config(_ALLOW_EXTRA)
+class BasicGroupIdentification(TypedDict, total=False):
+    """Basic group company identification from KMP documents."""
+    
+    analysis_performed: bool
+    data_sources_used: List[str]
+    identified_related_entities: List[RelatedEntity]
+    group_mapping_required: bool
+    additional_documents_needed: List[str]
+
+
+@with_config(_ALLOW_EXTRA)
+class Discrepancy(TypedDict, total=False):
+    """Discrepancy found while cross-validating documents."""
+    
+    type: str
+    details: str
+    severity: str
+
+
+@with_config(_ALLOW_EXTRA)
+class CrossValidationResults(TypedDict, total=False):
+    """Cross-validation results across documents."""
+    
+    entity_name_consistency: str
+    address_consistency: str
+    pan_cross_reference: str
+    partnership_deed_alignment: str
+    discrepancies: List[Discrepancy]
+
+
+@with_config(_ALLOW_EXTRA)
+class PANValidation(TypedDict, total=False):
+    """PAN validation results."""
+    
+    entity_pan: str
+    pan_status: str
+    name_match: str
+    status: str
+
+
+@with_config(_ALLOW_EXTRA)
+class AccountAnalysis(TypedDict, total=False):
+    """Summary of the borrower's bank accounts."""
+    
+    total_accounts: int
+    average_monthly_balance: float
+    transaction_volume: int
+    account_conduct: str
+
+
+@with_config(_ALLOW_EXTRA)
+class CashFlowPatterns(TypedDict, total=False):
+    """Monthly cash flow patterns from banking data."""
+    
+    monthly_inflows: float
+    monthly_outflows: float
+    net_monthly_surplus: float
+    seasonality_detected: str
+
+
+@with_config(_ALLOW_EXTRA)
+class BankingIntegrationAnalysis(TypedDict, total=False):
+    """Banking integration analysis."""
+    
+    account_analysis: AccountAnalysis
+    cash_flow_patterns: CashFlowPatterns
+
+
+@with_config(_ALLOW_EXTRA)
+class GSTFinancialReconciliation(TypedDict, total=False):
+    """GST-Financial reconciliation."""
+    
+    reconciliation_status: str
+    gst_reported_turnover: float
+    financial_statement_turnover: float
+    variance_explanation: str
+    adjusted_turnover: float
+
+
+@with_config(_ALLOW_EXTRA)
+class RiskAssessmentEnhancement(TypedDict, total=False):
+    """Enhanced risk assessment from financial analysis."""
+    
+    financial_risk_score: float
+    key_strengths: List[str]
+    concerns: List[str]
+    mitigation_factors: List[str]
@@ -0,0 +1,19 @@
+"""Shared constrained string types for identifier fields."""
+
+from typing import Annotated
+
+from pydantic import StringConstraints
+from typing_extensions import TypeAliasType
+
+# Named aliases are built once as schema definitions and referenced from every field
+# that uses them, so the pattern validator is shared rather than rebuilt per field.
+
+PAN = TypeAliasType(
+    "PAN",
+    Annotated[str, StringConstraints(pattern=r"^[A-Z]{5}[0-9]{4}[A-Z]$")],
+)
+
+GSTIN = TypeAliasType(
+    "GSTIN",
+    Annotated[str, StringConstraints(pattern=r"^[0-9]{2}[A-Z]{5}[0-9]{4}[A-Z][1-9A-Z]Z[0-9A-Z]$")],
+)
@@ -1,13 +1,26 @@
 """Models for verification and compliance analysis."""
 
+import math
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-from pydantic import Field
+from typing import Annotated, Dict, Iterable, List, Literal, NamedTuple, Optional, Any, Tuple
 
-from .base import BaseModel, ValidationResult
+import numpy as np
+from pydantic import Field, PrivateAttr
 
+from .base import AsRecord, BaseModel, ValueModel, ValidationResult, InternedStr, LowerStr
+from .validators import PAN, GSTIN
 
-class EntityCommercialBureau(BaseModel):
+# Minimum consumer CIBIL score for a KMP to pass bureau checks
+_CIBIL_THRESHOLD = 680
+
+_APPROVED_ELIGIBILITIES = frozenset({"approved", "conditionally_approved"})
+
+# Closed value sets; validation yields the shared literal objects
+RiskImpact = Literal["positive", "negative", "neutral"]
+ComplianceCheckStatus = Literal["pass", "fail", "requires_additional_data"]
+
+
+class EntityCommercialBureau(ValueModel):
     """Commercial bureau results for entity."""
     
     bureau_provider: str = Field(description="Bureau provider (e.g., CIBIL)")
@@ -17,8 +30,8 @@ class EntityCommercialBureau(BaseModel):
     credit_history_months: Optional[int] = Field(default=None, description="Credit history in months")
     total_exposure: Optional[float] = Field(default=None, description="Total credit exposure")
     overdue_amount: Optional[float] = Field(default=None, description="Overdue amount")
-    status: str = Field(description="Verification status (pass/fail)")
-    risk_indicators: List[str] = Field(default_factory=list, description="Risk indicators")
+    status: InternedStr = Field(description="Verification status (pass/fail)")
+    risk_indicators: List[InternedStr] = Field(default_factory=list, description="Risk indicators")
     
     # Detailed bureau data
     account_summary: Optional[Dict[str, Any]] = Field(default=None, description="Account summary")
@@ -38,12 +51,12 @@ class EntityCommercialBureau(BaseModel):
         return self.overdue_amount is not None and self.overdue_amount > 0
 
 
-class KMPConsumerBureau(BaseModel):
+class KMPConsumerBureau(ValueModel):
     """Consumer bureau results for KMP."""
     
     kmp_id: str = Field(description="KMP identifier")
     name: str = Field(description="KMP name")
-    pan_number: str = Field(description="PAN number")
+    pan_number: PAN = Field(description="PAN number")
     
     # CIBIL details
     cibil_score: Optional[int] = Field(default=None, description="CIBIL score")
@@ -62,7 +75,7 @@ class KMPConsumerBureau(BaseModel):
     overdue_amount: Optional[float] = Field(default=None, description="Overdue amount")
     
     # Status and flags
-    status: str = Field(description="Verification status (pass/fail)")
+    status: InternedStr = Field(description="Verification status (pass/fail)")
     risk_flags: List[str] = Field(default_factory=list, description="Risk flags")
     
     # Detailed data
@@ -72,7 +85,7 @@ class KMPConsumerBureau(BaseModel):
     @property
     def meets_cibil_threshold(self) -> bool:
         """Check if CIBIL score meets threshold (680+)."""
-        return self.cibil_score is not None and self.cibil_score >= 680
+        return self.cibil_score is not None and self.cibil_score >= _CIBIL_THRESHOLD
     
     @property
     def has_recent_enquiries(self) -> bool:
@@ -103,17 +116,17 @@ class PartnershipCibilCompliance(BaseModel):
         return self.compliance_percentage >= 0.5
 
 
-class GSTCompliance(BaseModel):
+class GSTCompliance(ValueModel):
     """GST compliance details."""
     
-    gst_number: str = Field(description="GST number")
-    registration_status: str = Field(description="Registration status")
+    gst_number: GSTIN = Field(description="GST number")
+    registration_status: LowerStr = Field(description="Registration status")
     registration_date: Optional[str] = Field(default=None, description="Registration date")
     last_return_filed: Optional[str] = Field(default=None, description="Last return filed date")
     filing_frequency: Optional[str] = Field(default=None, description="Filing frequency")
     compliance_score: Optional[int] = Field(default=None, description="Compliance score")
     pending_returns: int = Field(default=0, description="Number of pending returns")
-    status: str = Field(description="Overall compliance status")
+    status: InternedStr = Field(description="Overall compliance status")
     
     # Detailed compliance data
     return_filing_history: List[Dict[str, Any]] = Field(
@@ -128,7 +141,7 @@ class GSTCompliance(BaseModel):
     @property
     def is_active(self) -> bool:
         """Check if GST registration is active."""
-        return self.registration_status.lower() == "active"
+        return self.registration_status == "active"
     
     @property
     def has_pending_returns(self) -> bool:
@@ -163,8 +176,7 @@ class GSTTransactionAnalysis(BaseModel):
     @property
     def reconciliation_within_tolerance(self) -> bool:
         """Check if revenue reconciliation is within tolerance."""
-        reconciliation = self.revenue_reconciliation
-        return reconciliation.get("reconciliation_status") == "within_tolerance"
+        return self.revenue_reconciliation.get("reconciliation_status") == "within_tolerance"
 
 
 class EnhancedGSTAnalysis(BaseModel):
@@ -179,64 +191,87 @@ class EnhancedGSTAnalysis(BaseModel):
     seasonal_patterns: Optional[Dict[str, Any]] = Field(default=None, description="Seasonal patterns")
 
 
-class PolicyComplianceCheck(BaseModel):
+class PolicyComplianceCheck(NamedTuple):
     """Individual policy compliance check."""
     
-    check_name: str = Field(description="Name of the compliance check")
-    required: str = Field(description="Required value/condition")
-    achieved: Any = Field(description="Achieved value")
-    status: str = Field(description="Check status (pass/fail/requires_additional_data)")
-    details: Optional[Dict[str, Any]] = Field(default=None, description="Additional details")
+    check_name: Annotated[str, Field(description="Name of the compliance check")]
+    required: Annotated[str, Field(description="Required value/condition")]
+    achieved: Annotated[Any, Field(description="Achieved value")]
+    status: Annotated[ComplianceCheckStatus, Field(description="Check status (pass/fail/requires_additional_data)")]
+    details: Annotated[Optional[Dict[str, Any]], Field(description="Additional details")] = None
+
+
+# Compliance checks are stored as tuples but serialized as objects
+_ComplianceCheckRecord = Annotated[PolicyComplianceCheck, AsRecord]
 
 
 class PolicyComplianceAssessment(BaseModel):
     """Overall policy compliance assessment."""
     
-    bureau_score_compliance: Dict[str, PolicyComplianceCheck] = Field(
+    bureau_score_compliance: Dict[str, _ComplianceCheckRecord] = Field(
         description="Bureau score compliance checks"
     )
-    coverage_compliance: Dict[str, PolicyComplianceCheck] = Field(
+    coverage_compliance: Dict[str, _ComplianceCheckRecord] = Field(
         description="Coverage compliance checks"
     )
-    documentation_compliance: Dict[str, PolicyComplianceCheck] = Field(
+    documentation_compliance: Dict[str, _ComplianceCheckRecord] = Field(
         description="Documentation compliance checks"
     )
     gst_compliance_check: Dict[str, str] = Field(
         description="GST compliance check results"
     )
     
+    def _check_groups(self) -> Tuple[Dict[str, PolicyComplianceCheck], ...]:
+        """Get the three check groups, read live on every call."""
+        return (self.bureau_score_compliance, self.coverage_compliance, self.documentation_compliance)
+    
+    def add_check(self, group: str, name: str, check: PolicyComplianceCheck) -> None:
+        """Add a check to a group (e.g. 'coverage_compliance')."""
+        getattr(self, group)[name] = check
+    
+    def get_check(self, name: str) -> Optional[PolicyComplianceCheck]:
+        """Get a compliance check by name from any group."""
+        for group in self._check_groups():
+            check = group.get(name)
+            if check is not None:
+                return check
+        return None
+    
     def get_overall_status(self) -> str:
         """Get overall compliance status."""
-        all_checks = []
-        all_checks.extend(self.bureau_score_compliance.values())
-        all_checks.extend(self.coverage_compliance.values())
-        all_checks.extend(self.documentation_compliance.values())
-        
-        if all(check.status == "pass" for check in all_checks):
-            return "pass"
-        elif any(check.status == "fail" for check in all_checks):
-            return "fail"
-        else:
-            return "requires_additional_data"
+        # Single pass over the live groups: stop at the first failure
+        saw_non_pass = False
+        for group in self._check_groups():
+            for check in group.values():
+                status = check.status
+                if status == "fail":
+                    return "fail"
+                if status != "pass":
+                    saw_non_pass = True
+        return "requires_additional_data" if saw_non_pass else "pass"
 
 
-class RiskFactor(BaseModel):
+class RiskFactor(NamedTuple):
     """Individual risk factor."""
     
-    factor: str = Field(description="Risk factor description")
-    impact: str = Field(description="Impact (positive/negative/neutral)")
-    weight: float = Field(description="Weight in overall risk calculation")
-    score: Optional[float] = Field(default=None, description="Individual factor score")
+    factor: Annotated[str, Field(description="Risk factor description")]
+    impact: Annotated[RiskImpact, Field(description="Impact (positive/negative/neutral)")]
+    weight: Annotated[float, Field(description="Weight in overall risk calculation")]
+    score: Annotated[Optional[float], Field(description="Individual factor score")] = None
+
+
+# Risk factors are stored as tuples but serialized as objects
+_RiskFactorRecord = Annotated[RiskFactor, AsRecord]
 
 
 class RiskAssessment(BaseModel):
     """Comprehensive risk assessment."""
     
     overall_risk_score: float = Field(description="Overall risk score (0.0 to 1.0)")
-    risk_category: str = Field(description="Risk category (low/medium/high)")
+    risk_category: LowerStr = Field(description="Risk category (low/medium/high)")
     risk_grade: str = Field(description="Risk grade (A1, A2, B1, etc.)")
     
-    contributing_factors: List[RiskFactor] = Field(description="Contributing risk factors")
+    contributing_factors: List[_RiskFactorRecord] = Field(description="Contributing risk factors")
     mitigating_factors: List[str] = Field(default_factory=list, description="Mitigating factors")
     risk_mitigation_required: bool = Field(description="Whether risk mitigation is required")
     
@@ -245,26 +280,49 @@ class RiskAssessment(BaseModel):
     operational_risk_score: Optional[float] = Field(default=None, description="Operational risk component")
     compliance_risk_score: Optional[float] = Field(default=None, description="Compliance risk component")
     
-    def add_risk_factor(self, factor: str, impact: str, weight: float, score: Optional[float] = None) -> None:
-        """Add a risk factor."""
-        risk_factor = RiskFactor(factor=factor, impact=impact, weight=weight, score=score)
-        self.contributing_factors.append(risk_factor)
+    def add_risk_factor(
+        self, factor: str, impact: RiskImpact, weight: float, score: Optional[float] = None
+    ) -> None:
+        """Add a risk factor (values must already have the declared types)."""
+        self.contributing_factors.append(RiskFactor(factor, impact, weight, score))
+    
+    def extend_risk_factors(
+        self, rows: Iterable[Tuple[str, RiskImpact, float, Optional[float]]]
+    ) -> None:
+        """Add (factor, impact, weight, score) rows without per-factor validation.
+        
+        Intended for trusted internal producers; rows are not type-checked or coerced.
+        """
+        self.contributing_factors.extend(map(RiskFactor._make, rows))
+    
+    def risk_score_vector(self) -> Tuple[float, float, float, float]:
+        """Get the overall and component risk scores, with NaN for components not computed."""
+        nan = math.nan
+        credit = self.credit_risk_score
+        operational = self.operational_risk_score
+        compliance = self.compliance_risk_score
+        return (
+            self.overall_risk_score,
+            nan if credit is None else credit,
+            nan if operational is None else operational,
+            nan if compliance is None else compliance,
+        )
     
     @property
     def is_low_risk(self) -> bool:
         """Check if this is low risk."""
-        return self.risk_category.lower() == "low"
+        return self.risk_category == "low"
     
     @property
     def is_high_risk(self) -> bool:
         """Check if this is high risk."""
-        return self.risk_category.lower() == "high"
+        return self.risk_category == "high"
 
 
 class EligibilityDetermination(BaseModel):
     """Final eligibility determination."""
     
-    overall_eligibility: str = Field(description="Overall eligibility (approved/conditionally_approved/rejected)")
+    overall_eligibility: LowerStr = Field(description="Overall eligibility (approved/conditionally_approved/rejected)")
     approval_confidence: float = Field(description="Confidence in approval decision")
     
     conditions: List[str] = Field(default_factory=list, description="Conditions for approval")
@@ -277,7 +335,7 @@ class EligibilityDetermination(BaseModel):
     @property
     def is_approved(self) -> bool:
         """Check if application is approved."""
-        return self.overall_eligibility in ["approved", "conditionally_approved"]
+        return self.overall_eligibility in _APPROVED_ELIGIBILITIES
     
     @property
     def is_rejected(self) -> bool:
@@ -305,24 +363,64 @@ class BureauVerificationResults(BaseModel):
     kmps_meeting_threshold: int = Field(description="KMPs meeting CIBIL threshold")
     average_kmp_score: Optional[float] = Field(default=None, description="Average KMP CIBIL score")
     
+    # kmp_id -> bureau lookup over the list it was built from; a read indexes any entries
+    # appended since, and starts over if kmp_consumer_bureaus was replaced or shrank
+    _kmp_index: Dict[str, KMPConsumerBureau] = PrivateAttr(default_factory=dict)
+    _indexed_bureaus: Optional[List[KMPConsumerBureau]] = PrivateAttr(default=None)
+    _indexed_count: int = PrivateAttr(default=0)
+    
+    def add_kmp_bureau(self, bureau: KMPConsumerBureau) -> None:
+        """Add a KMP bureau result (the lookup index picks it up on the next read)."""
+        self.kmp_consumer_bureaus.append(bureau)
+    
     def get_kmp_bureau_by_id(self, kmp_id: str) -> Optional[KMPConsumerBureau]:
         """Get KMP bureau result by ID."""
-        for bureau in self.kmp_consumer_bureaus:
-            if bureau.kmp_id == kmp_id:
-                return bureau
-        return None
+        bureaus = self.kmp_consumer_bureaus
+        if self._indexed_bureaus is not bureaus or self._indexed_count > len(bureaus):
+            self._kmp_index = {}
+            self._indexed_bureaus = bureaus
+            self._indexed_count = 0
+        index = self._kmp_index
+        for position in range(self._indexed_count, len(bureaus)):
+            bureau = bureaus[position]
+            index.setdefault(bureau.kmp_id, bureau)
+        self._indexed_count = len(bureaus)
+        return index.get(kmp_id)
     
     def calculate_summary_stats(self) -> None:
-        """Calculate summary statistics."""
-        self.total_kmps_checked = len(self.kmp_consumer_bureaus)
-        self.kmps_meeting_threshold = sum(
-            1 for bureau in self.kmp_consumer_bureaus 
-            if bureau.meets_cibil_threshold
-        )
+        """Calculate summary statistics in a single pass over the KMP bureau results."""
+        total = 0
+        meeting_threshold = 0
+        score_sum = 0
+        score_count = 0
+        for bureau in self.kmp_consumer_bureaus:
+            total += 1
+            score = bureau.cibil_score
+            if score is not None:
+                score_sum += score
+                score_count += 1
+                if score >= _CIBIL_THRESHOLD:
+                    meeting_threshold += 1
         
-        valid_scores = [
-            bureau.cibil_score for bureau in self.kmp_consumer_bureaus 
-            if bureau.cibil_score is not None
-        ]
-        if valid_scores:
-            self.average_kmp_score = sum(valid_scores) / len(valid_scores)
+        # Plain counts/averages: skip assignment validation so the KMP index survives
+        self._set_trusted("total_kmps_checked", total)
+        self._set_trusted("kmps_meeting_threshold", meeting_threshold)
+        self._set_trusted("average_kmp_score", score_sum / score_count if score_count else None)
+
+
+# Column order of risk score matrices
+RISK_SCORE_COLUMNS = (
+    "overall_risk_score",
+    "credit_risk_score",
+    "operational_risk_score",
+    "compliance_risk_score",
+)
+
+
+def risk_score_matrix(assessments: List[RiskAssessment]) -> np.ndarray:
+    """Stack the risk scores of many assessments into an unboxed (N, 4) float64 matrix."""
+    return np.fromiter(
+        (assessment.risk_score_vector() for assessment in assessments),
+        dtype=np.dtype((np.float64, len(RISK_SCORE_COLUMNS))),
+        count=len(assessments),
+    )
@@ -6,20 +6,47 @@ the execution of all agents in the MSME loan processing pipeline.
 """
 
 import asyncio
+import functools
+import hashlib
 import logging
+import sys
+import threading
+import time
 from datetime import datetime
-from typing import Dict, Any, Optional, Literal
+from types import MappingProxyType
+from typing import AsyncIterator, Awaitable, Callable, Dict, Any, List, NamedTuple, Optional, Literal, Tuple, Union, cast
 
 from langgraph.graph import StateGraph, START, END
+from langgraph.errors import NodeError, NodeTimeoutError
+from langgraph.types import CachePolicy, Command, TimeoutPolicy
 from langchain_core.runnables import RunnableConfig
 
-# Optional PostgreSQL checkpointer - only import if available
+# Optional Redis persistence (checkpointer and node cache) - only import if available
 try:
-    from langgraph.checkpoint.postgres import PostgresCheckpointer
+    from redis.asyncio import Redis
+    from langgraph.cache.redis import RedisCache
+    _HAVE_REDIS = True
 except ImportError:
-    PostgresCheckpointer = None
+    _HAVE_REDIS = False
 
-from .models.state import MSMELoanState, AgentContext, ProcessingMetadata, RoutingDecision
+try:
+    from langgraph.checkpoint.redis import AsyncRedisSaver
+    _HAVE_REDIS_SAVER = True
+except ImportError:
+    _HAVE_REDIS_SAVER = False
+
+# Optional thread-distributed gather for free-threaded Python builds - only import if available
+try:
+    from thrasks import SchedulingMode, threaded_gather
+    _HAVE_THRASKS = True
+except ImportError:
+    _HAVE_THRASKS = False
+
+# True on a free-threaded (3.13t+) interpreter running with the GIL disabled
+_FREE_THREADED = _HAVE_THRASKS and not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+from .models.base import APIResponse
+from .models.state import MSMELoanState, AgentContext, EventLog, ProcessingMetadata, RoutingDecision
 from .models.loan_application import LoanApplication
 from .agents import (
     DocumentClassificationAgent,
@@ -29,11 +56,176 @@ from .agents import (
     BankingAnalysisAgent,
     FinalAssemblyAgent,
 )
+from .serde import ModelJsonSerializer
+from .services import BureauService, GSTService, MCAService, PANValidationService, close_http_client
 from .config import settings
 
 logger = logging.getLogger(__name__)
 
 
+class _AgentNodeSpec(NamedTuple):
+    """How to run one agent as a graph node."""
+    
+    name: str
+    previous_agent: Optional[str]
+    trigger_reason: str
+    result_fields: Tuple[str, ...]
+    routing: str  # name of the orchestrator's _determine_*_routing method
+    destinations: Tuple[str, ...]  # nodes the routing can goto; empty for the parallel branches
+    cached: bool = False  # output depends only on the loan application, so it can be reused on retry
+    prefetch: Optional[str] = None  # orchestrator method that fetches external data up front, if the agent uses it
+    flags: Optional[str] = None  # name of the orchestrator method deriving flat routing flags from the result
+
+
+def _loan_application_key(state: Union[MSMELoanState, Dict[str, Any]]) -> str:
+    """Node cache key: a digest of the loan application the run started from."""
+    # Graph drawing simulates the run with raw channel dicts
+    application = state.get("loan_application") if isinstance(state, dict) else state.loan_application
+    payload = application.to_json_bytes() if application is not None else b""
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+# Business rule thresholds every run starts from, built once from settings
+_BUSINESS_RULES: "MappingProxyType[str, Any]" = MappingProxyType({
+    "minimum_kmp_coverage": settings.minimum_kmp_coverage,
+    "minimum_consumer_cibil": settings.minimum_consumer_cibil,
+    "maximum_commercial_cmr": settings.maximum_commercial_cmr,
+    "eligible_constitutions": tuple(settings.eligible_constitutions),
+})
+
+def _config_for(thread_id: str) -> RunnableConfig:
+    """Run config addressing a loan application's checkpoint thread."""
+    # Root-graph checkpoints always live in the empty namespace; LangGraph reads any
+    # other checkpoint_ns as a subgraph path, so only the thread is configured
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def _as_state(values: Any) -> MSMELoanState:
+    """Build the workflow state from the channel values the graph returns."""
+    # The graph outputs a dict keyed by channel (error_log, warning_log, ...); callers
+    # get the model so properties like has_errors and errors keep working
+    if isinstance(values, MSMELoanState):
+        return values
+    return MSMELoanState.model_validate(values)
+
+
+# Batch runs in flight on each worker-thread event loop; the loops belong to thrasks,
+# so the last run on a loop closes the HTTP client that services opened on it
+_THREAD_LOOP_RUNS: Dict[asyncio.AbstractEventLoop, int] = {}
+_THREAD_LOOP_RUNS_LOCK = threading.Lock()
+
+
+async def _run_on_thread_loop(run: Awaitable[MSMELoanState]) -> MSMELoanState:
+    """Await one batch run on a worker thread's loop, closing the loop's HTTP client after its last run."""
+    loop = asyncio.get_running_loop()
+    with _THREAD_LOOP_RUNS_LOCK:
+        _THREAD_LOOP_RUNS[loop] = _THREAD_LOOP_RUNS.get(loop, 0) + 1
+    try:
+        return await run
+    finally:
+        with _THREAD_LOOP_RUNS_LOCK:
+            remaining = _THREAD_LOOP_RUNS.pop(loop) - 1
+            if remaining:
+                _THREAD_LOOP_RUNS[loop] = remaining
+        if not remaining:
+            await close_http_client()
+
+
+# Agents call LLMs and external services; a hung attempt fails into the node's error handler
+_NODE_TIMEOUT = TimeoutPolicy(run_timeout=settings.node_timeout_seconds)
+
+_NODE_CACHE_POLICY = CachePolicy(key_func=_loan_application_key, ttl=settings.node_cache_ttl_seconds)
+
+
+# Agent nodes built by MSMELoanOrchestrator._make_node (final assembly is the join and is hand-written)
+_AGENT_NODE_SPECS: Tuple[_AgentNodeSpec, ...] = (
+    _AgentNodeSpec(
+        "document_classification", None, "workflow_start",
+        ("classified_documents", "document_analysis", "missing_documents", "validation_warnings"),
+        "_determine_document_classification_routing",
+        ("entity_kmp_identification", "human_review", "error_handler"),
+        cached=True,
+        flags="_document_routing_flags",
+    ),
+    _AgentNodeSpec(
+        "entity_kmp_identification", "document_classification", "documents_classified_successfully",
+        ("entity_profile", "kmp_analysis", "basic_group_identification", "cross_validation_results"),
+        "_determine_entity_kmp_routing",
+        ("verification_compliance", "human_review", "error_handler"),
+        cached=True,
+    ),
+    _AgentNodeSpec(
+        "verification_compliance", "entity_kmp_identification", "minimum_coverage_achieved",
+        ("bureau_verification_results", "enhanced_gst_analysis", "pan_validation",
+         "policy_compliance_assessment", "risk_assessment", "eligibility_determination"),
+        "_determine_verification_routing",
+        ("financial_analysis", "banking_analysis", "human_review", "error_handler"),
+        prefetch="_prefetch_verification_data",
+    ),
+    # Financial and banking analysis run in parallel after verification
+    _AgentNodeSpec(
+        "financial_analysis", "verification_compliance", "comprehensive_analysis_required",
+        ("financial_health_assessment", "banking_integration_analysis", "gst_financial_reconciliation",
+         "loan_servicing_capacity", "risk_assessment_enhancement"),
+        "_determine_financial_routing",
+        (),
+    ),
+    _AgentNodeSpec(
+        "banking_analysis", "verification_compliance", "banking_validation_required",
+        ("banking_assessment",),
+        "_determine_banking_routing",
+        (),
+    ),
+)
+
+# Routing outcomes are frozen value objects, so each one is built once and shared
+_ROUTE_DOCUMENTS_CLASSIFIED = RoutingDecision(
+    next_agent="entity_kmp_identification",
+    routing_reason="Sufficient documents available for entity analysis",
+    conditions_met=("borrower_pan_available", "documents_classified"),
+)
+_ROUTE_DOCUMENTS_INSUFFICIENT = RoutingDecision(
+    next_agent="human_review",
+    routing_reason="Insufficient documents for automated processing",
+)
+_ROUTE_KMP_COVERAGE_MET = RoutingDecision(
+    next_agent="verification_compliance",
+    routing_reason="Minimum KMP coverage achieved",
+    conditions_met=("entity_identified", "minimum_coverage_achieved"),
+)
+_ROUTE_KMP_COVERAGE_INSUFFICIENT = RoutingDecision(
+    next_agent="human_review",
+    routing_reason="Insufficient KMP coverage",
+)
+_ROUTE_COMPLIANCE_PASSED = RoutingDecision(
+    next_agent="financial_analysis",
+    routing_reason="Basic compliance checks passed",
+    conditions_met=("bureau_scores_passed", "compliance_verified"),
+)
+_ROUTE_COMPLIANCE_ISSUES = RoutingDecision(
+    next_agent="human_review",
+    routing_reason="Compliance issues require manual review",
+)
+_ROUTE_FINANCIAL_COMPLETE = RoutingDecision(
+    next_agent="final_assembly",
+    routing_reason="Financial analysis complete, ready for final assembly",
+    conditions_met=("financial_statements_analyzed", "servicing_capacity_calculated"),
+)
+_ROUTE_FINANCIAL_REVIEW = RoutingDecision(
+    next_agent="human_review",
+    routing_reason="Financial analysis requires manual review",
+)
+_ROUTE_BANKING_COMPLETE = RoutingDecision(
+    next_agent="final_assembly",
+    routing_reason="Banking analysis complete, ready for final assembly",
+    conditions_met=("banking_analysis_completed",),
+)
+
+# The parallel branches always continue to the final_assembly join; their routing
+# decisions are recorded for it to act on
+_PARALLEL_BRANCHES: Tuple[str, ...] = ("financial_analysis", "banking_analysis")
+
+
 class MSMELoanOrchestrator:
     """
     Main orchestrator for MSME loan processing workflow.
@@ -42,12 +234,41 @@ class MSMELoanOrchestrator:
     state transitions, error handling, and routing decisions.
     """
     
-    def __init__(self, checkpointer: Optional[Any] = None):
+    def __init__(self, checkpointer: Optional[Any] = None, cache: Optional[Any] = None):
         """Initialize the orchestrator."""
         self.checkpointer = checkpointer
+        self.cache = cache if cache is not None else self._default_cache()
         self.agents = self._initialize_agents()
-        self.graph = self._build_graph()
+        self.services = self._initialize_services()
+        
+        # Share the class-wide compiled graph; nodes find this orchestrator in the run config
+        self.graph = self._compiled_graph().copy(
+            {"checkpointer": self.checkpointer, "cache": self.cache}
+        ).with_config(configurable={"orchestrator": self})
+        
+    @classmethod
+    async def with_redis_checkpointer(cls, redis_url: Optional[str] = None) -> "MSMELoanOrchestrator":
+        """Create an orchestrator that checkpoints to Redis, sharing one client with the node cache."""
+        if not (_HAVE_REDIS_SAVER and _HAVE_REDIS):
+            raise ImportError("Redis checkpointing requires the langgraph-checkpoint-redis package")
         
+        client = Redis.from_url(redis_url or settings.redis_url)
+        checkpointer = AsyncRedisSaver(redis_client=client)
+        await checkpointer.asetup()
+        
+        cache: Optional[Any] = RedisCache(client, serde=ModelJsonSerializer()) if settings.enable_node_cache else None
+        return cls(checkpointer=checkpointer, cache=cache)
+    
+    async def close(self) -> None:
+        """Release the pooled HTTP connections the agents and services use (call on shutdown)."""
+        await close_http_client()
+    
+    async def __aenter__(self) -> "MSMELoanOrchestrator":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+    
     def _initialize_agents(self) -> Dict[str, Any]:
         """Initialize all agents."""
         return {
@@ -59,498 +280,349 @@ class MSMELoanOrchestrator:
             "final_assembly": FinalAssemblyAgent(),
         }
     
-    def _build_graph(self) -> StateGraph:
+    def _initialize_services(self) -> Dict[str, Any]:
+        """Initialize the external API services used for prefetching."""
+        return {
+            "pan": PANValidationService(),
+            "mca": MCAService(),
+            "gst": GSTService(),
+            "bureau": BureauService(),
+        }
+    
+    def _default_cache(self) -> Optional[Any]:
+        """Get the Redis node cache if it is enabled and available."""
+        if not settings.enable_node_cache:
+            return None
+        if not _HAVE_REDIS:
+            logger.warning("Node cache enabled but redis is not installed; running uncached")
+            return None
+        return RedisCache(Redis.from_url(settings.redis_url), serde=ModelJsonSerializer())
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _compiled_graph(cls) -> Any:
+        """Build and compile the workflow graph once per orchestrator class."""
+        return cls._build_graph().compile()
+    
+    @classmethod
+    def _build_graph(cls) -> StateGraph:
         """Build the LangGraph workflow."""
         # Create the state graph
         builder = StateGraph(MSMELoanState)
         
         # Add agent nodes
-        builder.add_node("document_classification", self._document_classification_node)
-        builder.add_node("entity_kmp_identification", self._entity_kmp_identification_node)
-        builder.add_node("verification_compliance", self._verification_compliance_node)
-        builder.add_node("financial_analysis", self._financial_analysis_node)
-        builder.add_node("banking_analysis", self._banking_analysis_node)
-        builder.add_node("final_assembly", self._final_assembly_node)
+        for spec in _AGENT_NODE_SPECS:
+            builder.add_node(
+                spec.name,
+                cls._make_node(spec),
+                destinations=spec.destinations or None,
+                cache_policy=_NODE_CACHE_POLICY if spec.cached else None,
+                # The parallel branches time out and record failures themselves (see _make_node)
+                timeout=None if spec.name in _PARALLEL_BRANCHES else _NODE_TIMEOUT,
+                error_handler=None if spec.name in _PARALLEL_BRANCHES else cls._make_error_handler(spec.name, "error_handler"),
+            )
+        # Joins the parallel financial/banking branches: deferred until both have finished
+        builder.add_node(
+            "final_assembly",
+            cls._dispatch(cls._final_assembly_node),
+            defer=True,
+            destinations=("human_review", "error_handler", END),
+            timeout=_NODE_TIMEOUT,
+            error_handler=cls._make_error_handler("final_assembly", END),
+        )
         
         # Add error handling node
-        builder.add_node("error_handler", self._error_handler_node)
+        builder.add_node("error_handler", cls._dispatch(cls._error_handler_node))
         
         # Add human review node
-        builder.add_node("human_review", self._human_review_node)
+        builder.add_node("human_review", cls._dispatch(cls._human_review_node))
         
         # Define the workflow edges
         builder.add_edge(START, "document_classification")
         
-        # Conditional edges based on routing decisions
-        builder.add_conditional_edges(
-            "document_classification",
-            self._route_from_document_classification,
-            {
-                "entity_kmp_identification": "entity_kmp_identification",
-                "human_review": "human_review",
-                "error_handler": "error_handler",
-            }
-        )
-        
-        builder.add_conditional_edges(
-            "entity_kmp_identification",
-            self._route_from_entity_kmp,
-            {
-                "verification_compliance": "verification_compliance",
-                "human_review": "human_review",
-                "error_handler": "error_handler",
-            }
-        )
-        
-        builder.add_conditional_edges(
-            "verification_compliance",
-            self._route_from_verification,
-            {
-                "financial_analysis": "financial_analysis",
-                "human_review": "human_review",
-                "error_handler": "error_handler",
-            }
-        )
-        
-        builder.add_conditional_edges(
-            "financial_analysis",
-            self._route_from_financial,
-            {
-                "banking_analysis": "banking_analysis",
-                "human_review": "human_review",
-                "error_handler": "error_handler",
-            }
-        )
+        # Agent nodes route themselves with Command(goto=...); verification fans out
+        # to the parallel financial and banking branches
         
-        builder.add_conditional_edges(
-            "banking_analysis",
-            self._route_from_banking,
-            {
-                "final_assembly": "final_assembly",
-                "human_review": "human_review",
-                "error_handler": "error_handler",
-            }
-        )
+        # Fan in: final_assembly routes onward itself once both branches are done
+        builder.add_edge("financial_analysis", "final_assembly")
+        builder.add_edge("banking_analysis", "final_assembly")
         
-        builder.add_edge("final_assembly", END)
         builder.add_edge("human_review", END)
         builder.add_edge("error_handler", END)
         
-        # Compile the graph
-        return builder.compile(checkpointer=self.checkpointer)
+        return builder
     
-    async def _document_classification_node(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute document classification agent."""
-        try:
-            # Convert dict to MSMELoanState if needed
-            if isinstance(state, dict):
-                # Create MSMELoanState from dict
-                loan_state = MSMELoanState(**state)
-            else:
-                loan_state = state
-                
-            logger.info(f"Starting document classification for thread {loan_state.thread_id}")
-            
-            # Set agent context
-            loan_state.agent_context = AgentContext(
-                trigger_reason="workflow_start",
-                processing_timestamp=datetime.utcnow()
-            )
-            loan_state.update_step("document_classification")
-            
-            # Execute agent
-            agent = self.agents["document_classification"]
-            result = await agent.process(loan_state)
-            
-            # Update state with results
-            loan_state.classified_documents = result.classified_documents
-            loan_state.document_analysis = result.document_analysis
-            loan_state.missing_documents = result.missing_documents
-            loan_state.validation_warnings = result.validation_warnings
-            
-            # Add processing metadata
-            metadata = ProcessingMetadata(
-                start_time=loan_state.agent_context.processing_timestamp,
-                end_time=datetime.utcnow(),
-                total_processing_time=(datetime.utcnow() - loan_state.agent_context.processing_timestamp).total_seconds(),
-                api_calls_made=result.processing_metadata.api_calls_made,
-                total_api_cost=result.processing_metadata.total_api_cost
-            )
-            loan_state.add_processing_metadata("document_classification", metadata)
-            
-            # Determine routing
-            routing_decision = self._determine_document_classification_routing(result)
-            loan_state.add_routing_decision(routing_decision)
-            
-            # Return updated state as dict
-            return loan_state.model_dump()
-            
-        except Exception as e:
-            logger.error(f"Error in document classification: {str(e)}")
-            # Convert dict to MSMELoanState if needed for error handling
-            if isinstance(state, dict):
-                loan_state = MSMELoanState(**state)
-            else:
-                loan_state = state
-            loan_state.add_error("document_classification", str(e))
-            loan_state.workflow_status = "error"
-            return loan_state.model_dump()
+    @staticmethod
+    def _dispatch(method: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap an orchestrator node method to run on the orchestrator from the run config."""
+        async def node(state: MSMELoanState, config: RunnableConfig) -> Any:
+            return await method(config["configurable"]["orchestrator"], state)
+        
+        node.__name__ = method.__name__
+        return node
     
-    async def _entity_kmp_identification_node(self, state: MSMELoanState) -> Command[Literal["verification_compliance", "human_review", "error_handler"]]:
-        """Execute entity and KMP identification agent."""
-        try:
-            logger.info(f"Starting entity KMP identification for thread {state.thread_id}")
-            
-            # Set agent context
-            state.agent_context = AgentContext(
-                previous_agent="document_classification",
-                trigger_reason="documents_classified_successfully",
-                processing_timestamp=datetime.utcnow()
-            )
-            state.update_step("entity_kmp_identification")
-            
-            # Execute agent
-            agent = self.agents["entity_kmp_identification"]
-            result = await agent.process(state)
-            
-            # Update state with results
-            state.entity_profile = result.entity_profile
-            state.kmp_analysis = result.kmp_analysis
-            state.basic_group_identification = result.basic_group_identification
-            state.cross_validation_results = result.cross_validation_results
-            
-            # Add processing metadata
-            metadata = ProcessingMetadata(
-                start_time=state.agent_context.processing_timestamp,
-                end_time=datetime.utcnow(),
-                total_processing_time=(datetime.utcnow() - state.agent_context.processing_timestamp).total_seconds(),
-                api_calls_made=result.processing_metadata.api_calls_made,
-                total_api_cost=result.processing_metadata.total_api_cost
-            )
-            state.add_processing_metadata("entity_kmp_identification", metadata)
-            
-            # Determine routing
-            routing_decision = self._determine_entity_kmp_routing(result)
-            state.add_routing_decision(routing_decision)
-            
-            return Command(goto=routing_decision.next_agent)
-            
-        except Exception as e:
-            logger.error(f"Error in entity KMP identification: {str(e)}")
-            state.add_error("entity_kmp_identification", str(e))
-            return Command(goto="error_handler")
+    @staticmethod
+    def _make_error_handler(name: str, goto: str) -> Callable[..., Command]:
+        """Build the handler that records a node's exception or timeout and routes on."""
+        def handle_error(state: MSMELoanState, error: NodeError, config: RunnableConfig) -> Command:
+            logger.error(f"Error in {name}: {str(error.error)}")
+            update = config["configurable"]["orchestrator"]._agent_error(name, error.error)
+            if goto == END:
+                update["workflow_status"] = "error"
+            return Command(update=update, goto=goto)
+        
+        handle_error.__name__ = f"_{name}_error_handler"
+        return handle_error
     
-    async def _verification_compliance_node(self, state: MSMELoanState) -> Command[Literal["financial_analysis", "human_review", "error_handler"]]:
-        """Execute verification and compliance agent."""
-        try:
-            logger.info(f"Starting verification compliance for thread {state.thread_id}")
+    @classmethod
+    def _make_node(cls, spec: _AgentNodeSpec) -> Callable[..., Any]:
+        """Build the graph node coroutine that runs one agent."""
+        name = spec.name
+        result_fields = spec.result_fields
+        determine_routing = getattr(cls, spec.routing)
+        prefetch = getattr(cls, spec.prefetch) if spec.prefetch else None
+        flags = getattr(cls, spec.flags) if spec.flags else None
+        is_branch = name in _PARALLEL_BRANCHES
+        
+        async def run_agent(orchestrator: "MSMELoanOrchestrator", state: MSMELoanState) -> Union[Command, Dict[str, Any]]:
+            agent = orchestrator.agents[name]
+            t0 = time.perf_counter()
+            start_ts = datetime.utcnow()
+            logger.info(f"Starting {name} for thread {state.thread_id}")
             
             # Set agent context
-            state.agent_context = AgentContext(
-                previous_agent="entity_kmp_identification",
-                trigger_reason="minimum_coverage_achieved",
-                processing_timestamp=datetime.utcnow()
+            context = AgentContext(
+                previous_agent=spec.previous_agent,
+                trigger_reason=spec.trigger_reason,
+                processing_timestamp=start_ts
             )
-            state.update_step("verification_compliance")
+            state.agent_context = context
+            state.update_step(name)
             
             # Execute agent
-            agent = self.agents["verification_compliance"]
-            result = await agent.process(state)
-            
-            # Update state with results
-            state.bureau_verification_results = result.bureau_verification_results
-            state.enhanced_gst_analysis = result.enhanced_gst_analysis
-            state.pan_validation = result.pan_validation
-            state.policy_compliance_assessment = result.policy_compliance_assessment
-            state.risk_assessment = result.risk_assessment
-            state.eligibility_determination = result.eligibility_determination
-            
-            # Add processing metadata
-            metadata = ProcessingMetadata(
-                start_time=state.agent_context.processing_timestamp,
-                end_time=datetime.utcnow(),
-                total_processing_time=(datetime.utcnow() - state.agent_context.processing_timestamp).total_seconds(),
-                api_calls_made=result.processing_metadata.api_calls_made,
-                total_api_cost=result.processing_metadata.total_api_cost
-            )
-            state.add_processing_metadata("verification_compliance", metadata)
+            if prefetch is not None and agent.uses_prefetched:
+                result = await agent.process(state, prefetched=await prefetch(orchestrator, state))
+            else:
+                result = await agent.process(state)
             
             # Determine routing
-            routing_decision = self._determine_verification_routing(result)
-            state.add_routing_decision(routing_decision)
-            
-            return Command(goto=routing_decision.next_agent)
-            
-        except Exception as e:
-            logger.error(f"Error in verification compliance: {str(e)}")
-            state.add_error("verification_compliance", str(e))
-            return Command(goto="error_handler")
-    
-    async def _financial_analysis_node(self, state: MSMELoanState) -> Command[Literal["banking_analysis", "human_review", "error_handler"]]:
-        """Execute financial analysis agent."""
-        try:
-            logger.info(f"Starting financial analysis for thread {state.thread_id}")
-            
-            # Set agent context
-            state.agent_context = AgentContext(
-                previous_agent="verification_compliance",
-                trigger_reason="comprehensive_analysis_required",
-                processing_timestamp=datetime.utcnow()
-            )
-            state.update_step("financial_analysis")
-            
-            # Execute agent
-            agent = self.agents["financial_analysis"]
-            result = await agent.process(state)
-            
-            # Update state with results
-            state.financial_health_assessment = result.financial_health_assessment
-            state.banking_integration_analysis = result.banking_integration_analysis
-            state.gst_financial_reconciliation = result.gst_financial_reconciliation
-            state.loan_servicing_capacity = result.loan_servicing_capacity
-            state.risk_assessment_enhancement = result.risk_assessment_enhancement
+            routing_decision = determine_routing(orchestrator, result)
             
-            # Add processing metadata
-            metadata = ProcessingMetadata(
-                start_time=state.agent_context.processing_timestamp,
-                end_time=datetime.utcnow(),
-                total_processing_time=(datetime.utcnow() - state.agent_context.processing_timestamp).total_seconds(),
-                api_calls_made=result.processing_metadata.api_calls_made,
-                total_api_cost=result.processing_metadata.total_api_cost
+            # Return only this agent's results
+            update = orchestrator._agent_update(
+                name, context, orchestrator._make_metadata(t0, start_ts, result), routing_decision,
+                **{field: getattr(result, field) for field in result_fields}
             )
-            state.add_processing_metadata("financial_analysis", metadata)
-            
-            # Determine routing
-            routing_decision = self._determine_financial_routing(result)
-            state.add_routing_decision(routing_decision)
-            
-            return Command(goto=routing_decision.next_agent)
+            if flags is not None:
+                update.update(flags(orchestrator, result))
+            if is_branch:
+                return update
+            return Command(update=update, goto=orchestrator._next_nodes(routing_decision, state))
+        
+        async def node(state: Union[MSMELoanState, Dict[str, Any]], config: RunnableConfig) -> Union[Command, Dict[str, Any]]:
+            orchestrator: MSMELoanOrchestrator = config["configurable"]["orchestrator"]
             
-        except Exception as e:
-            logger.error(f"Error in financial analysis: {str(e)}")
-            state.add_error("financial_analysis", str(e))
-            return Command(goto="error_handler")
+            # LangGraph passes the validated state; a raw dict is trusted as-is
+            if isinstance(state, dict):
+                state = MSMELoanState.model_construct(**state)
+            if not is_branch:
+                return await run_agent(orchestrator, state)
+            
+            # Node error handlers cannot yet recover a node that fails while a sibling
+            # runs in the same step (LangGraph re-raises it when the step ends), so a
+            # branch records its own failure and still reaches the final_assembly join
+            timeout = settings.node_timeout_seconds
+            try:
+                return await asyncio.wait_for(run_agent(orchestrator, state), timeout)
+            except asyncio.TimeoutError:
+                error: Exception = NodeTimeoutError(name, timeout, kind="run", run_timeout=timeout)
+            except Exception as e:
+                error = e
+            logger.error(f"Error in {name}: {str(error)}")
+            return orchestrator._agent_error(name, error)
+        
+        node.__name__ = f"_{name}_node"
+        return node
     
-    async def _banking_analysis_node(self, state: MSMELoanState) -> Command[Literal["final_assembly", "human_review", "error_handler"]]:
-        """Execute banking analysis agent."""
-        try:
-            logger.info(f"Starting banking analysis for thread {state.thread_id}")
-            
-            # Set agent context
-            state.agent_context = AgentContext(
-                previous_agent="financial_analysis",
-                trigger_reason="banking_validation_required",
-                processing_timestamp=datetime.utcnow()
-            )
-            state.update_step("banking_analysis")
-            
-            # Execute agent
-            agent = self.agents["banking_analysis"]
-            result = await agent.process(state)
-            
-            # Update state with results
-            state.banking_assessment = result.banking_assessment
-            
-            # Add processing metadata
-            metadata = ProcessingMetadata(
-                start_time=state.agent_context.processing_timestamp,
-                end_time=datetime.utcnow(),
-                total_processing_time=(datetime.utcnow() - state.agent_context.processing_timestamp).total_seconds(),
-                api_calls_made=result.processing_metadata.api_calls_made,
-                total_api_cost=result.processing_metadata.total_api_cost
-            )
-            state.add_processing_metadata("banking_analysis", metadata)
-            
-            # Determine routing
-            routing_decision = self._determine_banking_routing(result)
-            state.add_routing_decision(routing_decision)
-            
-            return Command(goto=routing_decision.next_agent)
-            
-        except Exception as e:
-            logger.error(f"Error in banking analysis: {str(e)}")
-            state.add_error("banking_analysis", str(e))
+    async def _final_assembly_node(self, state: MSMELoanState) -> Command[Literal["human_review", "error_handler", "__end__"]]:
+        """Join the financial and banking branches, then execute final assembly agent."""
+        # Either branch may have failed or asked for manual review
+        if state.has_errors:
             return Command(goto="error_handler")
+        if not self._ready_for_final_assembly(state):
+            return Command(goto="human_review")
+        
+        t0 = time.perf_counter()
+        start_ts = datetime.utcnow()
+        logger.info(f"Starting final assembly for thread {state.thread_id}")
+        
+        # Set agent context
+        context = AgentContext(
+            previous_agent="banking_analysis",
+            trigger_reason="all_analysis_completed",
+            processing_timestamp=start_ts
+        )
+        state.agent_context = context
+        state.update_step("final_assembly")
+        
+        # Execute agent
+        agent = self.agents["final_assembly"]
+        result = await agent.process(state)
+        
+        # Add processing metadata
+        metadata = self._make_metadata(t0, start_ts, result)
+        update = self._agent_update("final_assembly", context, metadata)
+        update["final_report"] = result.final_report
+        update["workflow_status"] = "completed"
+        
+        logger.info(f"Completed loan processing for thread {state.thread_id}")
+        return Command(update=update, goto=cast(Literal["__end__"], END))
     
-    async def _final_assembly_node(self, state: MSMELoanState) -> MSMELoanState:
-        """Execute final assembly agent."""
-        try:
-            logger.info(f"Starting final assembly for thread {state.thread_id}")
-            
-            # Set agent context
-            state.agent_context = AgentContext(
-                previous_agent="banking_analysis",
-                trigger_reason="all_analysis_completed",
-                processing_timestamp=datetime.utcnow()
-            )
-            state.update_step("final_assembly")
-            
-            # Execute agent
-            agent = self.agents["final_assembly"]
-            result = await agent.process(state)
-            
-            # Update state with results
-            state.final_report = result.final_report
-            state.workflow_status = "completed"
-            
-            # Add processing metadata
-            metadata = ProcessingMetadata(
-                start_time=state.agent_context.processing_timestamp,
-                end_time=datetime.utcnow(),
-                total_processing_time=(datetime.utcnow() - state.agent_context.processing_timestamp).total_seconds(),
-                api_calls_made=result.processing_metadata.api_calls_made,
-                total_api_cost=result.processing_metadata.total_api_cost
-            )
-            state.add_processing_metadata("final_assembly", metadata)
-            
-            logger.info(f"Completed loan processing for thread {state.thread_id}")
-            return state
-            
-        except Exception as e:
-            logger.error(f"Error in final assembly: {str(e)}")
-            state.add_error("final_assembly", str(e))
-            state.workflow_status = "error"
-            return state
-    
-    async def _error_handler_node(self, state: MSMELoanState) -> MSMELoanState:
+    async def _error_handler_node(self, state: MSMELoanState) -> Dict[str, Any]:
         """Handle errors in the workflow."""
         logger.error(f"Error handler triggered for thread {state.thread_id}")
-        state.workflow_status = "error"
-        state.update_step("error_handling")
-        return state
+        return {"workflow_status": "error", "current_step": "error_handling", "last_updated": datetime.utcnow()}
     
-    async def _human_review_node(self, state: MSMELoanState) -> MSMELoanState:
+    async def _human_review_node(self, state: MSMELoanState) -> Dict[str, Any]:
         """Handle human review requirements."""
         logger.info(f"Human review required for thread {state.thread_id}")
-        state.workflow_status = "human_review_required"
-        state.update_step("human_review")
-        return state
+        return {"workflow_status": "human_review_required", "current_step": "human_review", "last_updated": datetime.utcnow()}
     
-    # Routing decision methods
-    def _route_from_document_classification(self, state: MSMELoanState) -> str:
-        """Route from document classification based on results."""
-        if state.has_errors:
-            return "error_handler"
+    async def _prefetch_verification_data(self, state: MSMELoanState) -> Dict[str, Any]:
+        """Run the verification agent's independent external lookups concurrently, each with its own timeout."""
+        services = self.services
+        lookups: Dict[str, Any] = {}
         
-        # Check if we have sufficient documents
-        if (state.classified_documents and 
-            len(state.classified_documents.borrower_documents.get("pan_cards", [])) > 0):
-            return "entity_kmp_identification"
-        else:
-            return "human_review"
-    
-    def _route_from_entity_kmp(self, state: MSMELoanState) -> str:
-        """Route from entity KMP identification based on results."""
-        if state.has_errors:
-            return "error_handler"
+        if state.entity_profile:
+            entity = state.entity_profile.borrowing_entity
+            lookups["pan_validation"] = services["pan"].validate_pan(entity.pan_number)
+            lookups["commercial_bureau"] = services["bureau"].get_commercial_bureau_report(entity.pan_number)
+            if entity.gst_number:
+                lookups["gst_filing_status"] = services["gst"].get_filing_status(entity.gst_number)
+            if entity.cin_number:
+                lookups["mca_company_details"] = services["mca"].get_company_details(entity.cin_number)
         
-        # Check if minimum KMP coverage is met
-        if (state.kmp_analysis and 
-            state.kmp_analysis.kmp_coverage_analysis.coverage_percentage >= 0.5):
-            return "verification_compliance"
-        else:
-            return "human_review"
-    
-    def _route_from_verification(self, state: MSMELoanState) -> str:
-        """Route from verification based on results."""
-        if state.has_errors:
-            return "error_handler"
+        if state.kmp_analysis:
+            kmp_pans = [kmp.pan_number for kmp in state.kmp_analysis.identified_kmps if kmp.pan_number]
+            if kmp_pans:
+                lookups["consumer_bureau"] = services["bureau"].get_multiple_consumer_reports(kmp_pans)
         
-        # Check eligibility determination
-        if (state.eligibility_determination and 
-            state.eligibility_determination.overall_eligibility != "rejected"):
-            return "financial_analysis"
-        else:
-            return "human_review"
-    
-    def _route_from_financial(self, state: MSMELoanState) -> str:
-        """Route from financial analysis based on results."""
-        if state.has_errors:
-            return "error_handler"
+        if not lookups:
+            return {}
+        
+        # Each lookup has its own timeout, so a slow service only loses its own result;
+        # the total wait is the slowest lookup rather than the sum
+        timeout = settings.external_api_timeout_seconds
+        results = await asyncio.gather(
+            *(asyncio.wait_for(lookup, timeout) for lookup in lookups.values()),
+            return_exceptions=True,
+        )
         
-        # Check if we have banking documents for analysis
-        if (state.classified_documents and 
-            len(state.classified_documents.banking_documents) > 0):
-            return "banking_analysis"
-        else:
-            return "human_review"
+        # Raised errors become failed responses, so agents only ever check .success
+        prefetched = {}
+        for name, result in zip(lookups, results):
+            if isinstance(result, asyncio.TimeoutError):
+                logger.warning(f"Prefetch {name} timed out after {timeout}s for thread {state.thread_id}")
+                result = APIResponse(success=False, error=f"{name} lookup timeout", status_code=408)
+            elif isinstance(result, Exception):
+                logger.warning(f"Prefetch {name} failed for thread {state.thread_id}: {result}")
+                result = APIResponse(success=False, error=f"{name} lookup error: {result}", status_code=500)
+            prefetched[name] = result
+        return prefetched
     
-    def _route_from_banking(self, state: MSMELoanState) -> str:
-        """Route from banking analysis based on results."""
-        if state.has_errors:
-            return "error_handler"
+    def _make_metadata(self, t0: float, start_ts: datetime, result: Any) -> ProcessingMetadata:
+        """Build an agent's processing metadata, timing it with the monotonic clock."""
+        return ProcessingMetadata(
+            start_time=start_ts,
+            end_time=datetime.utcnow(),
+            total_processing_time=time.perf_counter() - t0,
+            api_calls_made=result.processing_metadata.api_calls_made,
+            total_api_cost=result.processing_metadata.total_api_cost
+        )
+    
+    # Node update helpers: nodes return only the fields they changed, and the state
+    # reducers merge metadata, routing decisions and errors from parallel branches
+    def _agent_update(
+        self,
+        agent_name: str,
+        context: AgentContext,
+        metadata: ProcessingMetadata,
+        routing_decision: Optional[RoutingDecision] = None,
+        **results: Any,
+    ) -> Dict[str, Any]:
+        """Build the state update for an agent that completed."""
+        update = {
+            **results,
+            "current_step": agent_name,
+            "agent_context": context,
+            "processing_metadata": {agent_name: metadata},
+            "last_updated": metadata.end_time,
+        }
+        if routing_decision is not None:
+            update["routing_decisions"] = [routing_decision]
+        return update
+    
+    def _agent_error(self, agent_name: str, error: Exception) -> Dict[str, Any]:
+        """Build the state update for an agent that raised."""
+        now = datetime.utcnow()
+        return {"error_log": EventLog.single(agent_name, str(error), now), "last_updated": now}
+    
+    # Routing decision methods
+    def _next_nodes(self, decision: RoutingDecision, state: MSMELoanState) -> Union[str, List[str]]:
+        """Get the node(s) to go to for a routing decision, fanning out to the analysis branches."""
+        if decision.next_agent != "financial_analysis":
+            return decision.next_agent
         
-        # Always proceed to final assembly after banking analysis
-        return "final_assembly"
+        # Banking analysis only needs the banking documents, not the financial results
+        if state.has_banking_documents:
+            return list(_PARALLEL_BRANCHES)
+        return ["financial_analysis"]
+    
+    def _document_routing_flags(self, result: Any) -> Dict[str, Any]:
+        """Summarize classified documents into flat flags for the later routing checks."""
+        classified_documents = result.classified_documents
+        return {"has_banking_documents": bool(classified_documents and classified_documents.banking_documents)}
+    
+    def _ready_for_final_assembly(self, state: MSMELoanState) -> bool:
+        """Check that both analysis branches ran and neither asked for manual review."""
+        if not state.has_banking_documents:
+            return False
+        return all(decision.next_agent != "human_review" for decision in state.routing_decisions)
     
     # Helper methods for routing decisions
     def _determine_document_classification_routing(self, result: Any) -> RoutingDecision:
         """Determine routing decision from document classification."""
         if result.routing_decision.next_agent == "entity_kmp_identification":
-            return RoutingDecision(
-                next_agent="entity_kmp_identification",
-                routing_reason="Sufficient documents available for entity analysis",
-                conditions_met=["borrower_pan_available", "documents_classified"]
-            )
-        else:
-            return RoutingDecision(
-                next_agent="human_review",
-                routing_reason="Insufficient documents for automated processing",
-                conditions_met=[]
-            )
+            return _ROUTE_DOCUMENTS_CLASSIFIED
+        return _ROUTE_DOCUMENTS_INSUFFICIENT
     
     def _determine_entity_kmp_routing(self, result: Any) -> RoutingDecision:
         """Determine routing decision from entity KMP identification."""
-        if result.routing_decision.next_agent == "verification_compliance":
-            return RoutingDecision(
-                next_agent="verification_compliance",
-                routing_reason="Minimum KMP coverage achieved",
-                conditions_met=["entity_identified", "minimum_coverage_achieved"]
-            )
-        else:
-            return RoutingDecision(
-                next_agent="human_review",
-                routing_reason="Insufficient KMP coverage",
-                conditions_met=[]
-            )
+        # Also require minimum KMP coverage
+        kmp_analysis = result.kmp_analysis
+        if (result.routing_decision.next_agent == "verification_compliance" and kmp_analysis and
+                kmp_analysis.kmp_coverage_analysis.coverage_percentage >= 0.5):
+            return _ROUTE_KMP_COVERAGE_MET
+        return _ROUTE_KMP_COVERAGE_INSUFFICIENT
     
     def _determine_verification_routing(self, result: Any) -> RoutingDecision:
         """Determine routing decision from verification."""
-        if result.routing_decision.next_agent == "financial_analysis":
-            return RoutingDecision(
-                next_agent="financial_analysis",
-                routing_reason="Basic compliance checks passed",
-                conditions_met=["bureau_scores_passed", "compliance_verified"]
-            )
-        else:
-            return RoutingDecision(
-                next_agent="human_review",
-                routing_reason="Compliance issues require manual review",
-                conditions_met=[]
-            )
+        # Also require that the borrower was not rejected
+        eligibility = result.eligibility_determination
+        if (result.routing_decision.next_agent == "financial_analysis" and eligibility and
+                eligibility.overall_eligibility != "rejected"):
+            return _ROUTE_COMPLIANCE_PASSED
+        return _ROUTE_COMPLIANCE_ISSUES
     
     def _determine_financial_routing(self, result: Any) -> RoutingDecision:
         """Determine routing decision from financial analysis."""
-        if result.routing_decision.next_agent == "banking_analysis":
-            return RoutingDecision(
-                next_agent="banking_analysis",
-                routing_reason="Financial analysis complete, banking validation required",
-                conditions_met=["financial_statements_analyzed", "servicing_capacity_calculated"]
-            )
-        else:
-            return RoutingDecision(
-                next_agent="human_review",
-                routing_reason="Financial analysis requires manual review",
-                conditions_met=[]
-            )
+        if result.routing_decision.next_agent in ("banking_analysis", "final_assembly"):
+            return _ROUTE_FINANCIAL_COMPLETE
+        return _ROUTE_FINANCIAL_REVIEW
     
     def _determine_banking_routing(self, result: Any) -> RoutingDecision:
         """Determine routing decision from banking analysis."""
-        return RoutingDecision(
-            next_agent="final_assembly",
-            routing_reason="Banking analysis complete, ready for final assembly",
-            conditions_met=["banking_analysis_completed"]
-        )
+        return _ROUTE_BANKING_COMPLETE
     
     async def process_loan_application(self, loan_application: LoanApplication) -> MSMELoanState:
         """
@@ -562,64 +634,95 @@ class MSMELoanOrchestrator:
         Returns:
             Final state after processing
         """
-        # Initialize state
-        initial_state = MSMELoanState(
-            thread_id=loan_application.thread_id,
-            loan_application=loan_application,
-            messages=[],  # Required by MessagesState
-            business_rules={
-                "minimum_kmp_coverage": settings.minimum_kmp_coverage,
-                "minimum_consumer_cibil": settings.minimum_consumer_cibil,
-                "maximum_commercial_cmr": settings.maximum_commercial_cmr,
-                "eligible_constitutions": settings.eligible_constitutions,
-            }
-        )
-        
-        # Configure the run
-        config = RunnableConfig(
-            configurable={
-                "thread_id": loan_application.thread_id,
-                "checkpoint_ns": "msme_loan_processing"
-            }
-        )
+        initial_state = self._initial_state(loan_application)
+        config = _config_for(loan_application.thread_id)
         
-        # Execute the workflow
+        # Execute the workflow, keeping the state emitted after the last step
         try:
-            final_state = await self.graph.ainvoke(initial_state, config=config)
-            return final_state
+            final_values: Dict[str, Any] = {}
+            async for final_values in self.graph.astream(initial_state, config=config, stream_mode="values"):
+                pass
+            return _as_state(final_values)
         except Exception as e:
             logger.error(f"Error processing loan application {loan_application.thread_id}: {str(e)}")
             initial_state.add_error("orchestrator", str(e))
             initial_state.workflow_status = "error"
             return initial_state
     
+    async def process_loan_application_stream(self, loan_application: LoanApplication) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process a loan application, yielding each node's state update as it completes.
+        
+        Lets callers report progress (e.g. over server-sent events) before the whole
+        workflow finishes. Stop iterating to abandon the remaining nodes, for example
+        once a human_review update arrives. Workflow exceptions are raised to the caller.
+        
+        Args:
+            loan_application: The loan application to process
+            
+        Yields:
+            Mappings of node name to the state update that node returned
+        """
+        config = _config_for(loan_application.thread_id)
+        async for update in self.graph.astream(
+            self._initial_state(loan_application), config=config, stream_mode="updates"
+        ):
+            yield update
+    
+    def _initial_state(self, loan_application: LoanApplication) -> MSMELoanState:
+        """Build the workflow's starting state for a loan application."""
+        # The application is already validated; LangGraph validates the state it hands to nodes.
+        # Checkpointers cannot serialize a mappingproxy, so the state gets a plain copy
+        return MSMELoanState.model_construct(
+            thread_id=loan_application.thread_id,
+            loan_application=loan_application,
+            business_rules=dict(_BUSINESS_RULES),
+        )
+    
+    async def process_loan_applications(self, loan_applications: List[LoanApplication]) -> List[MSMELoanState]:
+        """
+        Process a batch of loan applications concurrently.
+        
+        Agents keep per-run counters, so each application gets its own orchestrator
+        (cheap, since the compiled graph is shared). On a free-threaded interpreter
+        with thrasks installed, the runs are spread across per-thread event loops so
+        their CPU-bound validation/serialization runs in parallel; that path is only
+        taken without a checkpointer or cache, whose async clients are loop-bound.
+        Each worker loop's shared HTTP client is closed once its last run finishes.
+        
+        Args:
+            loan_applications: The loan applications to process
+            
+        Returns:
+            Final states, in the same order as the applications
+        """
+        runs = [
+            type(self)(checkpointer=self.checkpointer, cache=self.cache).process_loan_application(application)
+            for application in loan_applications
+        ]
+        if _FREE_THREADED and self.checkpointer is None and self.cache is None:
+            threaded_runs = [_run_on_thread_loop(run) for run in runs]
+            states: List[MSMELoanState] = await threaded_gather(*threaded_runs, mode=SchedulingMode.QUEUE)
+            return states
+        return await asyncio.gather(*runs)
+    
     async def get_state(self, thread_id: str) -> Optional[MSMELoanState]:
         """Get the current state for a thread."""
         if not self.checkpointer:
             return None
         
-        config = RunnableConfig(
-            configurable={
-                "thread_id": thread_id,
-                "checkpoint_ns": "msme_loan_processing"
-            }
-        )
+        config = _config_for(thread_id)
         
         try:
             state = await self.graph.aget_state(config)
-            return state.values if state else None
+            return _as_state(state.values) if state and state.values else None
         except Exception as e:
             logger.error(f"Error getting state for thread {thread_id}: {str(e)}")
             return None
     
     async def resume_processing(self, thread_id: str, user_input: Optional[Dict[str, Any]] = None) -> MSMELoanState:
         """Resume processing from a checkpoint."""
-        config = RunnableConfig(
-            configurable={
-                "thread_id": thread_id,
-                "checkpoint_ns": "msme_loan_processing"
-            }
-        )
+        config = _config_for(thread_id)
         
         try:
             # If user input is provided, update the state
@@ -627,8 +730,8 @@ class MSMELoanOrchestrator:
                 await self.graph.aupdate_state(config, user_input)
             
             # Resume processing
-            final_state = await self.graph.ainvoke(None, config=config)
-            return final_state
+            final_values = await self.graph.ainvoke(None, config=config)
+            return _as_state(final_values)
         except Exception as e:
             logger.error(f"Error resuming processing for thread {thread_id}: {str(e)}")
             # Return error state
@@ -0,0 +1,76 @@
+"""Checkpoint serialization for MSME underwriting workflow state."""
+
+import functools
+import importlib
+from typing import Any, Tuple, Type
+
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from pydantic import ValidationError
+from pydantic_core import from_json
+
+from .models.base import BaseModel
+
+# Type tags for a model, or a list of one model class, stored as b"<module>:<qualname>\n<json>"
+_MODEL_JSON = "model_json"
+_MODEL_LIST_JSON = "model_list_json"
+
+# Only models defined in this package are restored from the stored class path
+_MODELS_PACKAGE = "msme_underwriting.models."
+
+
+@functools.lru_cache(maxsize=None)
+def _model_class(path: str) -> Type[BaseModel]:
+    """Resolve a stored "<module>:<qualname>" path to a model class from this package."""
+    module_name, _, qualname = path.partition(":")
+    if not module_name.startswith(_MODELS_PACKAGE):
+        raise ValueError(f"Refusing to restore model from outside {_MODELS_PACKAGE}: {path}")
+    cls = getattr(importlib.import_module(module_name), qualname)
+    if not (isinstance(cls, type) and issubclass(cls, BaseModel)):
+        raise ValueError(f"Not a model class: {path}")
+    return cls
+
+
+def _is_package_model(cls: type) -> bool:
+    return issubclass(cls, BaseModel) and cls.__module__.startswith(_MODELS_PACKAGE)
+
+
+def _header(cls: type) -> bytes:
+    return f"{cls.__module__}:{cls.__qualname__}\n".encode()
+
+
+class ModelJsonSerializer(JsonPlusSerializer):
+    """
+    LangGraph serializer that stores this package's models as JSON bytes.
+
+    The default serializer walks each pydantic model into Python dicts with
+    model_dump(), msgpacks them, and re-validates with cls(**data) on load.
+    Channel values and writes that are models from this package, or lists of
+    a single such model class, are instead encoded by the compiled core
+    serializer and restored with model_validate_json, with no intermediate
+    dicts. Everything else falls through to the default serializer.
+    """
+
+    def dumps_typed(self, obj: Any) -> Tuple[str, bytes]:
+        cls = type(obj)
+        if _is_package_model(cls):
+            return _MODEL_JSON, _header(cls) + cls.__pydantic_serializer__.to_json(obj, warnings=False)
+        if cls is list and obj:
+            item_cls = type(obj[0])
+            if _is_package_model(item_cls) and all(type(item) is item_cls for item in obj):
+                return _MODEL_LIST_JSON, _header(item_cls) + item_cls.dump_many_json(obj)
+        return super().dumps_typed(obj)
+
+    def loads_typed(self, data: Tuple[str, bytes]) -> Any:
+        type_, payload = data
+        if type_ == _MODEL_LIST_JSON:
+            header, _, body = bytes(payload).partition(b"\n")
+            return _model_class(header.decode()).validate_many(body)
+        if type_ == _MODEL_JSON:
+            header, _, body = bytes(payload).partition(b"\n")
+            cls = _model_class(header.decode())
+            try:
+                return cls.model_validate_json(body)
+            except ValidationError:
+                # Same fallback as the default serializer for data that no longer validates
+                return cls.model_construct(**from_json(body))
+        return super().loads_typed(data)
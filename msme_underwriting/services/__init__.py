@@ -8,6 +8,8 @@ from .external_apis import (
     CIBILService,
     GSTService,
     BureauService,
+    get_http_client,
+    close_http_client,
 )
 
 __all__ = [
@@ -18,4 +20,6 @@ __all__ = [
     "CIBILService",
     "GSTService",
     "BureauService",
+    "get_http_client",
+    "close_http_client",
 ]
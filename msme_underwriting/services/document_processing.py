@@ -7,9 +7,19 @@ import logging
 
 from ..models.base import APIResponse
 from ..config import settings
+from .external_apis import dump_json, get_http_client, parse_json
 
 logger = logging.getLogger(__name__)
 
+# MIME types accepted by the processing service (lowercase)
+_SUPPORTED_TYPES = frozenset({
+    "application/pdf",
+    "image/jpeg",
+    "image/jpg",
+    "image/png",
+    "application/zip",
+})
+
 
 class DocumentProcessingService:
     """
@@ -19,11 +29,15 @@ class DocumentProcessingService:
     API that extracts structured data from uploaded documents.
     """
     
-    def __init__(self):
-        """Initialize the document processing service."""
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """Initialize the document processing service; without a client, the shared pooled client is used."""
         self.base_url = settings.document_processing_service_url
         self.api_key = settings.document_processing_api_key
+        self.client = client
         self.timeout = 300  # 5 minutes timeout for document processing
+        # Request headers are fixed per service, so build them once
+        self._auth_headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+        self._headers = {"Content-Type": "application/json", **self._auth_headers}
         
     async def process_documents(self, request_payload: Dict[str, Any]) -> APIResponse:
         """
@@ -38,44 +52,38 @@ class DocumentProcessingService:
         try:
             logger.info(f"Processing {len(request_payload.get('files', []))} documents")
             
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}" if self.api_key else None
-            }
+            client = self.client or await get_http_client()
+            # Encode the (large) payload with orjson when available; the JSON content type is in self._headers
+            response = await client.post(
+                f"{self.base_url}/process-documents",
+                headers=self._headers,
+                timeout=self.timeout,
+                content=dump_json(request_payload)
+            )
             
-            # Remove None values from headers
-            headers = {k: v for k, v in headers.items() if v is not None}
+            response_time = response.elapsed.total_seconds()
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/process-documents",
-                    json=request_payload,
-                    headers=headers
+            if response.status_code == 200:
+                data = parse_json(response)
+                logger.info(f"Document processing completed successfully in {response_time:.2f}s")
+                
+                return APIResponse(
+                    success=True,
+                    data=data,
+                    status_code=response.status_code,
+                    response_time=response_time
                 )
+            else:
+                error_msg = f"Document processing failed with status {response.status_code}"
+                logger.error(error_msg)
                 
-                response_time = response.elapsed.total_seconds()
+                return APIResponse(
+                    success=False,
+                    error=error_msg,
+                    status_code=response.status_code,
+                    response_time=response_time
+                )
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    logger.info(f"Document processing completed successfully in {response_time:.2f}s")
-                    
-                    return APIResponse(
-                        success=True,
-                        data=data,
-                        status_code=response.status_code,
-                        response_time=response_time
-                    )
-                else:
-                    error_msg = f"Document processing failed with status {response.status_code}"
-                    logger.error(error_msg)
-                    
-                    return APIResponse(
-                        success=False,
-                        error=error_msg,
-                        status_code=response.status_code,
-                        response_time=response_time
-                    )
-                    
         except httpx.TimeoutException:
             error_msg = "Document processing service timeout"
             logger.error(error_msg)
@@ -114,31 +122,27 @@ class DocumentProcessingService:
             API response with job status
         """
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}" if self.api_key else None
-            }
-            headers = {k: v for k, v in headers.items() if v is not None}
+            client = self.client or await get_http_client()
+            response = await client.get(
+                f"{self.base_url}/job-status/{job_id}",
+                headers=self._auth_headers,
+                timeout=30
+            )
             
-            async with httpx.AsyncClient(timeout=30) as client:
-                response = await client.get(
-                    f"{self.base_url}/job-status/{job_id}",
-                    headers=headers
+            if response.status_code == 200:
+                data = parse_json(response)
+                return APIResponse(
+                    success=True,
+                    data=data,
+                    status_code=response.status_code
+                )
+            else:
+                return APIResponse(
+                    success=False,
+                    error=f"Failed to get job status: {response.status_code}",
+                    status_code=response.status_code
                 )
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    return APIResponse(
-                        success=True,
-                        data=data,
-                        status_code=response.status_code
-                    )
-                else:
-                    return APIResponse(
-                        success=False,
-                        error=f"Failed to get job status: {response.status_code}",
-                        status_code=response.status_code
-                    )
-                    
         except Exception as e:
             return APIResponse(
                 success=False,
@@ -157,15 +161,7 @@ class DocumentProcessingService:
         Returns:
             True if format is supported, False otherwise
         """
-        supported_types = [
-            "application/pdf",
-            "image/jpeg", 
-            "image/jpg",
-            "image/png",
-            "application/zip"
-        ]
-        
-        return file_type.lower() in supported_types
+        return file_type.lower() in _SUPPORTED_TYPES
     
     async def estimate_processing_time(self, files: list) -> int:
         """
@@ -182,7 +178,9 @@ class DocumentProcessingService:
         time_per_file = 15  # Additional time per file
         
         total_files = len(files)
-        total_size = sum(file.get("file_size", 0) for file in files)
+        total_size = 0
+        for file in files:
+            total_size += file.get("file_size", 0)
         
         # Add time based on total size (rough estimate)
         size_factor = total_size / (1024 * 1024)  # Size in MB
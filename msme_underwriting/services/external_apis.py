@@ -1,74 +1,217 @@
 """External API services for MSME underwriting."""
 
 import asyncio
+import functools
 import httpx
-from typing import Dict, Any, Optional, List
+import importlib.util
+import json
+import numpy as np
+from typing import Awaitable, Callable, Dict, Any, Optional, List, Tuple
 import logging
-from datetime import datetime
+import random
+import time
+import weakref
 
 from ..models.base import APIResponse
 from ..config import settings
 
+# Optional HTTP/2 support (httpx[http2]) - only enabled if h2 is installed
+_HAVE_H2 = importlib.util.find_spec("h2") is not None
+
+# Optional orjson for faster JSON parsing and encoding - only import if available
+try:
+    import orjson
+    _HAVE_ORJSON = True
+except ImportError:
+    _HAVE_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
+# One pooled client per event loop: connections (and their TLS sessions) are reused
+# across services and workflow runs, but cannot be shared between loops. With HTTP/2,
+# concurrent calls to the same API (e.g. a multi-PAN bureau pull) share one connection
+_HTTP_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+# Upstream throttling / gateway errors worth retrying; other 4xx/5xx are returned as-is
+_RETRYABLE_STATUS = frozenset({429, 502, 503, 504})
+
+# Non-idempotent requests (e.g. billed bureau pulls) are only retried when the server
+# cannot have acted on them: the connection was never made, or the server rejected
+# the request with an explicit Retry-After
+_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+_RETRY_AFTER_STATUS = frozenset({429, 503})
+
+
+def _should_retry_response(response: httpx.Response, idempotent: bool) -> bool:
+    """Whether a response is a transient failure that is safe to send again."""
+    if idempotent:
+        return response.status_code in _RETRYABLE_STATUS
+    return response.status_code in _RETRY_AFTER_STATUS and "Retry-After" in response.headers
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """Seconds to wait before retry number attempt + 1, honouring a numeric Retry-After."""
+    cap = settings.api_retry_max_seconds
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), cap)
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+    initial = settings.api_retry_initial_seconds
+    return min(cap, initial * 2.0 ** attempt + random.uniform(0, initial))
+
+
+def parse_json(response: httpx.Response) -> Any:
+    """Parse a JSON response body, with orjson when it is installed."""
+    if _HAVE_ORJSON:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def dump_json(payload: Any) -> bytes:
+    """Encode a JSON request body, with orjson when it is installed."""
+    if _HAVE_ORJSON:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+async def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _HTTP_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = _HTTP_CLIENTS[loop] = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+            ),
+            http2=settings.http2_enabled and _HAVE_H2,
+        )
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the running event loop's shared HTTP client (call on application shutdown)."""
+    client = _HTTP_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+# Most lookups kept per service instance before the oldest is dropped
+_LOOKUP_CACHE_SIZE = 1024
+
+
+def _cached_lookup(method: Callable[..., Awaitable[APIResponse]]) -> Callable[..., Awaitable[APIResponse]]:
+    """Reuse a read-only lookup's successful response on the same service for a short TTL."""
+    @functools.wraps(method)
+    async def lookup(self: "BaseAPIService", *args: Any, **kwargs: Any) -> APIResponse:
+        key = (method.__name__, *args, *sorted(kwargs.items()))
+        cached = self._lookup_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            # Callers may modify the response they get, so never hand out the cached one
+            return cached[1].model_copy(deep=True)
+        
+        response = await method(self, *args, **kwargs)
+        ttl = settings.lookup_cache_ttl_seconds
+        if response.success and ttl > 0:
+            if len(self._lookup_cache) >= _LOOKUP_CACHE_SIZE:
+                self._lookup_cache.pop(next(iter(self._lookup_cache)))
+            self._lookup_cache[key] = (time.monotonic() + ttl, response.model_copy(deep=True))
+        return response
+    
+    return lookup
+
 
 class BaseAPIService:
     """Base class for external API services."""
     
-    def __init__(self, service_name: str, base_url: str, api_key: Optional[str] = None):
-        """Initialize base API service."""
+    def __init__(self, service_name: str, base_url: str, api_key: Optional[str] = None,
+                 client: Optional[httpx.AsyncClient] = None):
+        """Initialize base API service; without a client, the shared pooled client is used."""
         self.service_name = service_name
         self.base_url = base_url
         self.api_key = api_key
+        self.client = client
         self.timeout = 30
+        # Request headers are fixed per service, so build them once
+        self._headers = {
+            "Content-Type": "application/json",
+            "User-Agent": "MSME-Underwriting/1.0"
+        }
+        if api_key:
+            self._headers["Authorization"] = f"Bearer {api_key}"
+        self._lookup_cache: Dict[Tuple[Any, ...], Tuple[float, APIResponse]] = {}
         
     async def _make_request(self, method: str, endpoint: str, 
                           data: Optional[Dict[str, Any]] = None,
-                          params: Optional[Dict[str, Any]] = None) -> APIResponse:
-        """Make HTTP request to external API."""
+                          params: Optional[Dict[str, Any]] = None,
+                          idempotent: Optional[bool] = None) -> APIResponse:
+        """
+        Make HTTP request to external API.
+        
+        Transient failures are retried with backoff. Requests are treated as
+        idempotent only if they are GETs, unless idempotent is passed explicitly;
+        a non-idempotent request is never re-sent once the server may have run it.
+        """
         try:
-            headers = {
-                "Content-Type": "application/json",
-                "User-Agent": "MSME-Underwriting/1.0"
-            }
-            
-            if self.api_key:
-                headers["Authorization"] = f"Bearer {self.api_key}"
-            
             url = f"{self.base_url}/{endpoint.lstrip('/')}"
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                if method.upper() == "GET":
-                    response = await client.get(url, headers=headers, params=params)
-                elif method.upper() == "POST":
-                    response = await client.post(url, headers=headers, json=data, params=params)
+            method = method.upper()
+            if method not in ("GET", "POST"):
+                raise ValueError(f"Unsupported HTTP method: {method}")
+            if idempotent is None:
+                idempotent = method == "GET"
+            
+            # Retry with exponential backoff; the pooled connection makes a retry cheap
+            client = self.client or await get_http_client()
+            attempts = max(1, settings.api_max_attempts)
+            for attempt in range(attempts):
+                last_attempt = attempt == attempts - 1
+                try:
+                    response = await client.request(
+                        method, url, headers=self._headers, params=params,
+                        json=data if method == "POST" else None, timeout=self.timeout
+                    )
+                except httpx.TransportError as e:
+                    # A timeout may fire after the server already ran the request
+                    if last_attempt or not (idempotent or isinstance(e, _UNSENT_ERRORS)):
+                        raise
+                    delay = _retry_delay(attempt)
+                    reason = type(e).__name__
                 else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
+                    if last_attempt or not _should_retry_response(response, idempotent):
+                        break
+                    delay = _retry_delay(attempt, response)
+                    reason = str(response.status_code)
+                logger.warning(f"{self.service_name} API {reason}, retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+            
+            response_time = response.elapsed.total_seconds()
+            
+            if response.status_code == 200:
+                try:
+                    response_data = parse_json(response)
+                except:
+                    response_data = {"raw_response": response.text}
                 
-                response_time = response.elapsed.total_seconds()
+                return APIResponse(
+                    success=True,
+                    data=response_data,
+                    status_code=response.status_code,
+                    response_time=response_time
+                )
+            else:
+                error_msg = f"{self.service_name} API error: {response.status_code}"
+                logger.error(f"{error_msg} - {response.text}")
                 
-                if response.status_code == 200:
-                    try:
-                        response_data = response.json()
-                    except:
-                        response_data = {"raw_response": response.text}
-                    
-                    return APIResponse(
-                        success=True,
-                        data=response_data,
-                        status_code=response.status_code,
-                        response_time=response_time
-                    )
-                else:
-                    error_msg = f"{self.service_name} API error: {response.status_code}"
-                    logger.error(f"{error_msg} - {response.text}")
-                    
-                    return APIResponse(
-                        success=False,
-                        error=error_msg,
-                        status_code=response.status_code,
-                        response_time=response_time
-                    )
+                return APIResponse(
+                    success=False,
+                    error=error_msg,
+                    status_code=response.status_code,
+                    response_time=response_time
+                )
                     
         except httpx.TimeoutException:
             error_msg = f"{self.service_name} API timeout"
@@ -79,21 +222,47 @@ class BaseAPIService:
             error_msg = f"{self.service_name} API error: {str(e)}"
             logger.error(error_msg)
             return APIResponse(success=False, error=error_msg, status_code=500)
+    
+    async def _hedged_request(self, method: str, endpoint: str,
+                              data: Optional[Dict[str, Any]] = None,
+                              params: Optional[Dict[str, Any]] = None) -> APIResponse:
+        """
+        Make an idempotent request, sending a backup copy if the first is slow.
+        
+        After settings.hedge_after_seconds without a response a second identical
+        request is started; whichever finishes first is returned and the other is
+        cancelled. Only use for reads that are safe to repeat.
+        """
+        delay = settings.hedge_after_seconds
+        if delay <= 0:
+            return await self._make_request(method, endpoint, data=data, params=params)
+        
+        tasks = {asyncio.ensure_future(self._make_request(method, endpoint, data=data, params=params))}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                logger.info(f"{self.service_name} {endpoint} slower than {delay}s; sending hedged request")
+                tasks.add(asyncio.ensure_future(self._make_request(method, endpoint, data=data, params=params)))
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            return done.pop().result()
+        finally:
+            for task in tasks:
+                task.cancel()
 
 
 class FileStorageService(BaseAPIService):
     """Service for file storage operations."""
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         """Initialize file storage service."""
-        super().__init__("FileStorage", "http://localhost:8002")  # Example URL
+        super().__init__("FileStorage", "http://localhost:8002", client=client)  # Example URL
     
     async def store_file(self, file_path: str, metadata: Dict[str, Any]) -> APIResponse:
         """Store a file with metadata."""
         data = {
             "file_path": file_path,
             "metadata": metadata,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
         }
         return await self._make_request("POST", "/store", data=data)
     
@@ -109,10 +278,11 @@ class FileStorageService(BaseAPIService):
 class PANValidationService(BaseAPIService):
     """Service for PAN validation."""
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         """Initialize PAN validation service."""
-        super().__init__("PAN", "https://api.pan-validation.com", settings.pan_api_key)
+        super().__init__("PAN", "https://api.pan-validation.com", settings.pan_api_key, client=client)
     
+    @_cached_lookup
     async def validate_pan(self, pan_number: str) -> APIResponse:
         """
         Validate PAN number and get details.
@@ -158,19 +328,21 @@ class PANValidationService(BaseAPIService):
 class MCAService(BaseAPIService):
     """Service for MCA (Ministry of Corporate Affairs) data."""
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         """Initialize MCA service."""
-        super().__init__("MCA", "https://api.mca.gov.in", settings.mca_api_key)
+        super().__init__("MCA", "https://api.mca.gov.in", settings.mca_api_key, client=client)
     
+    @_cached_lookup
     async def get_company_details(self, cin: str) -> APIResponse:
         """Get company details by CIN."""
         params = {"cin": cin}
-        return await self._make_request("GET", "/company-details", params=params)
+        return await self._hedged_request("GET", "/company-details", params=params)
     
+    @_cached_lookup
     async def get_director_details(self, din: str) -> APIResponse:
         """Get director details by DIN."""
         params = {"din": din}
-        return await self._make_request("GET", "/director-details", params=params)
+        return await self._hedged_request("GET", "/director-details", params=params)
     
     async def search_company_by_name(self, company_name: str) -> APIResponse:
         """Search company by name."""
@@ -181,9 +353,9 @@ class MCAService(BaseAPIService):
 class CIBILService(BaseAPIService):
     """Service for CIBIL credit bureau data."""
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         """Initialize CIBIL service."""
-        super().__init__("CIBIL", "https://api.cibil.com", settings.cibil_api_key)
+        super().__init__("CIBIL", "https://api.cibil.com", settings.cibil_api_key, client=client)
     
     async def get_consumer_report(self, pan_number: str, consent: bool = True) -> APIResponse:
         """
@@ -269,10 +441,11 @@ class CIBILService(BaseAPIService):
 class GSTService(BaseAPIService):
     """Service for GST data and compliance."""
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         """Initialize GST service."""
-        super().__init__("GST", "https://api.gst.gov.in", settings.gst_api_key)
+        super().__init__("GST", "https://api.gst.gov.in", settings.gst_api_key, client=client)
     
+    @_cached_lookup
     async def get_gst_details(self, gst_number: str) -> APIResponse:
         """Get GST registration details."""
         params = {"gstin": gst_number}
@@ -295,6 +468,7 @@ class GSTService(BaseAPIService):
         }
         return await self._make_request("GET", "/returns", params=params)
     
+    @_cached_lookup
     async def get_filing_status(self, gst_number: str) -> APIResponse:
         """Get GST filing status and compliance."""
         params = {"gstin": gst_number}
@@ -306,7 +480,8 @@ class GSTService(BaseAPIService):
             total_returns = filing_data.get("total_returns_due", 0)
             filed_returns = filing_data.get("returns_filed", 0)
             
-            compliance_score = (filed_returns / total_returns * 100) if total_returns > 0 else 0
+            # One division, with the percentage scaling done in the numerator
+            compliance_score = (filed_returns * 100 / total_returns) if total_returns > 0 else 0.0
             
             standardized_data = {
                 "gst_number": gst_number,
@@ -348,13 +523,14 @@ class GSTService(BaseAPIService):
             monthly_turnovers = turnover_data.get("monthly_turnover", [])
             
             if monthly_turnovers:
-                total_turnover = sum(monthly_turnovers)
-                average_monthly = total_turnover / len(monthly_turnovers)
+                turnovers = np.asarray(monthly_turnovers, dtype=np.float64)
+                total_turnover = float(turnovers.sum())
+                average_monthly = total_turnover / turnovers.size
                 
-                # Calculate growth rate
-                if len(monthly_turnovers) >= 2:
-                    first_half = sum(monthly_turnovers[:len(monthly_turnovers)//2])
-                    second_half = sum(monthly_turnovers[len(monthly_turnovers)//2:])
+                # Calculate growth rate (second half is the remainder of the total, no second pass)
+                if turnovers.size >= 2:
+                    first_half = float(turnovers[:turnovers.size // 2].sum())
+                    second_half = total_turnover - first_half
                     growth_rate = ((second_half - first_half) / first_half * 100) if first_half > 0 else 0
                 else:
                     growth_rate = 0
@@ -377,9 +553,9 @@ class GSTService(BaseAPIService):
 class BureauService:
     """Unified service for credit bureau operations."""
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         """Initialize bureau service."""
-        self.cibil_service = CIBILService()
+        self.cibil_service = CIBILService(client)
     
     async def get_consumer_bureau_report(self, pan_number: str) -> APIResponse:
         """Get consumer bureau report (CIBIL)."""
@@ -391,12 +567,17 @@ class BureauService:
     
     async def get_multiple_consumer_reports(self, pan_numbers: List[str]) -> Dict[str, APIResponse]:
         """Get consumer reports for multiple PANs."""
-        tasks = [
-            self.cibil_service.get_consumer_report(pan) 
-            for pan in pan_numbers
-        ]
+        # Cap in-flight requests so a large partnership doesn't trip bureau rate limits;
+        # created per call so it always belongs to the running event loop
+        semaphore = asyncio.Semaphore(settings.cibil_max_concurrency)
+        
+        async def get_report(pan: str) -> APIResponse:
+            async with semaphore:
+                return await self.cibil_service.get_consumer_report(pan)
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # KMPs can share a PAN (e.g. a proprietor listed in several roles); fetch each report once
+        pan_numbers = list(dict.fromkeys(pan_numbers))
+        results = await asyncio.gather(*(get_report(pan) for pan in pan_numbers), return_exceptions=True)
         
         return {
             pan: result if not isinstance(result, Exception) else APIResponse(
@@ -419,18 +600,16 @@ class BureauService:
             Compliance analysis
         """
         total_partners = len(bureau_results)
-        partners_with_scores = 0
-        partners_above_threshold = 0
-        scores = []
-        
-        for pan, response in bureau_results.items():
-            if response.success and response.data:
-                cibil_score = response.data.get("cibil_score")
-                if cibil_score is not None:
-                    partners_with_scores += 1
-                    scores.append(cibil_score)
-                    if cibil_score >= threshold:
-                        partners_above_threshold += 1
+        scores = np.fromiter(
+            (
+                response.data["cibil_score"]
+                for response in bureau_results.values()
+                if response.success and response.data and response.data.get("cibil_score") is not None
+            ),
+            dtype=np.float64,
+        )
+        partners_with_scores = int(scores.size)
+        partners_above_threshold = int(np.count_nonzero(scores >= threshold))
         
         compliance_percentage = partners_above_threshold / total_partners if total_partners > 0 else 0
         meets_50_percent_rule = compliance_percentage >= 0.5
@@ -442,7 +621,7 @@ class BureauService:
             "partners_above_threshold": partners_above_threshold,
             "compliance_percentage": compliance_percentage,
             "meets_50_percent_rule": meets_50_percent_rule,
-            "average_score": sum(scores) / len(scores) if scores else None,
+            "average_score": float(scores.mean()) if scores.size else None,
             "compliance_status": "compliant" if meets_50_percent_rule else "non_compliant",
             "additional_kmps_needed": max(0, int(total_partners * 0.5) - partners_above_threshold)
         }
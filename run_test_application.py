@@ -1,5 +1,12 @@
 import asyncio
 from datetime import datetime
+
+# Optional uvloop event loop - only import if available
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from msme_underwriting.orchestrator import MSMELoanOrchestrator
 from msme_underwriting.models.loan_application import (
     LoanApplication,
@@ -52,6 +59,8 @@ async def main():
     print("-" * 50)
     
     final_state = await orchestrator.process_loan_application(loan_application)
+    # Release the pooled external API connections
+    await orchestrator.close()
 
     print("-" * 50)
     print("Workflow processing finished.")
@@ -72,5 +81,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    # This runs the main async function
-    asyncio.run(main())
\ No newline at end of file
+    # This runs the main async function, on uvloop's faster event loop when installed
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
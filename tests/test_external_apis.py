@@ -0,0 +1,168 @@
+"""Tests for the external API request retry policy."""
+
+from typing import Callable, List
+
+import httpx
+import pytest
+
+from msme_underwriting.config import settings
+from msme_underwriting.services.external_apis import BaseAPIService
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Retry immediately so tests do not sleep."""
+    monkeypatch.setattr(settings, "api_max_attempts", 3)
+    monkeypatch.setattr(settings, "api_retry_initial_seconds", 0.0)
+
+
+def reply(status_code: int, body: bytes = b"", **headers: str) -> httpx.Response:
+    """Build a streamed mock response (httpx only times responses whose body is read)."""
+    return httpx.Response(status_code, headers=headers, stream=httpx.ByteStream(body))
+
+
+def make_service(handler: Handler) -> BaseAPIService:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return BaseAPIService("Test", "http://api.test", client=client)
+
+
+def failing_then_ok(calls: List[httpx.Request], failure: Handler) -> Handler:
+    """Handler that fails on the first call and succeeds afterwards."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return failure(request)
+        return reply(200, b'{"ok": true}')
+    return handler
+
+
+async def test_get_retries_gateway_error() -> None:
+    calls: List[httpx.Request] = []
+    service = make_service(failing_then_ok(calls, lambda request: reply(502)))
+
+    response = await service._make_request("GET", "/lookup")
+
+    assert response.success
+    assert response.data == {"ok": True}
+    assert len(calls) == 2
+
+
+async def test_get_retries_read_timeout() -> None:
+    calls: List[httpx.Request] = []
+
+    def timeout(request: httpx.Request) -> httpx.Response:
+        raise httpx.ReadTimeout("slow", request=request)
+
+    service = make_service(failing_then_ok(calls, timeout))
+
+    response = await service._make_request("GET", "/lookup")
+
+    assert response.success
+    assert len(calls) == 2
+
+
+async def test_get_gives_up_after_max_attempts() -> None:
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return reply(503)
+
+    response = await make_service(handler)._make_request("GET", "/lookup")
+
+    assert not response.success
+    assert response.status_code == 503
+    assert len(calls) == 3
+
+
+async def test_client_error_is_not_retried() -> None:
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return reply(404)
+
+    response = await make_service(handler)._make_request("GET", "/lookup")
+
+    assert response.status_code == 404
+    assert len(calls) == 1
+
+
+async def test_post_is_not_retried_after_read_timeout() -> None:
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        raise httpx.ReadTimeout("slow", request=request)
+
+    response = await make_service(handler)._make_request("POST", "/consumer-report", data={"pan": "x"})
+
+    assert not response.success
+    assert response.status_code == 408
+    assert len(calls) == 1
+
+
+async def test_post_is_not_retried_on_gateway_error() -> None:
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return reply(502)
+
+    response = await make_service(handler)._make_request("POST", "/consumer-report", data={"pan": "x"})
+
+    assert response.status_code == 502
+    assert len(calls) == 1
+
+
+async def test_post_retries_connect_error() -> None:
+    calls: List[httpx.Request] = []
+
+    def refused(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    service = make_service(failing_then_ok(calls, refused))
+
+    response = await service._make_request("POST", "/consumer-report", data={"pan": "x"})
+
+    assert response.success
+    assert len(calls) == 2
+
+
+async def test_post_retries_throttling_with_retry_after() -> None:
+    calls: List[httpx.Request] = []
+
+    def throttled(request: httpx.Request) -> httpx.Response:
+        return reply(429, **{"Retry-After": "0"})
+
+    service = make_service(failing_then_ok(calls, throttled))
+
+    response = await service._make_request("POST", "/consumer-report", data={"pan": "x"})
+
+    assert response.success
+    assert len(calls) == 2
+
+
+async def test_post_throttling_without_retry_after_is_not_retried() -> None:
+    calls: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return reply(429)
+
+    response = await make_service(handler)._make_request("POST", "/consumer-report", data={"pan": "x"})
+
+    assert response.status_code == 429
+    assert len(calls) == 1
+
+
+async def test_post_marked_idempotent_retries_like_get() -> None:
+    calls: List[httpx.Request] = []
+    service = make_service(failing_then_ok(calls, lambda request: reply(504)))
+
+    response = await service._make_request("POST", "/search", data={"q": "x"}, idempotent=True)
+
+    assert response.success
+    assert len(calls) == 2
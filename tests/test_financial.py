@@ -0,0 +1,13 @@
+"""Tests for financial analysis models."""
+
+from msme_underwriting.models.financial import LiquidityAssessment, LiquidityRatios
+
+
+def test_ratio_checks_follow_copy_updates() -> None:
+    ratios = LiquidityRatios(current_ratio_2023=2.0, assessment=LiquidityAssessment.ADEQUATE)
+    assert ratios.has_adequate_liquidity
+
+    copy = ratios.model_copy(update={"current_ratio_2023": 0.5})
+
+    assert not copy.has_adequate_liquidity
+    assert ratios.has_adequate_liquidity
@@ -0,0 +1,109 @@
+"""Tests for KMP analysis models."""
+
+from typing import Optional
+
+from msme_underwriting.models.kmp import (
+    ConstitutionRequirements,
+    IdentifiedKMP,
+    KMPAnalysis,
+    KMPCoverageAnalysis,
+    KYCCompleteness,
+)
+
+
+def make_kmp(kmp_id: str = "k1", risk_score: Optional[float] = None) -> IdentifiedKMP:
+    return IdentifiedKMP(
+        kmp_id=kmp_id,
+        name="A Partner",
+        role="partner",
+        shareholding_percentage=10.0,
+        documents_available=("PAN_CARD",),
+        kyc_completeness=KYCCompleteness.COMPLETE,
+        risk_score=risk_score,
+    )
+
+
+def make_analysis(*kmps: IdentifiedKMP) -> KMPAnalysis:
+    return KMPAnalysis(
+        constitution_requirements=ConstitutionRequirements(
+            entity_type="partnership", minimum_coverage_required=0.5, required_documents=()
+        ),
+        identified_kmps=list(kmps),
+        kmp_coverage_analysis=KMPCoverageAnalysis(
+            total_partners_identified=len(kmps),
+            partners_with_complete_kyc=len(kmps),
+            partners_with_partial_kyc=0,
+            total_shareholding_covered=0.0,
+            coverage_percentage=0.0,
+            minimum_coverage_met=False,
+        ),
+    )
+
+
+def test_derived_values() -> None:
+    kmp = make_kmp()
+
+    assert kmp.has_complete_kyc
+    assert kmp.effective_share == 10.0
+    assert kmp.get_missing_documents_for_kyc() == ["aadhaar_card"]
+
+
+def test_derived_values_on_constructed_kmp() -> None:
+    kmp = IdentifiedKMP.model_construct(
+        kmp_id="k1",
+        name="A Partner",
+        role="partner",
+        partnership_share=25.0,
+        documents_available=("pan_card", "aadhaar_card"),
+        kyc_completeness=KYCCompleteness.COMPLETE,
+    )
+
+    assert kmp.has_complete_kyc
+    assert kmp.effective_share == 25.0
+    assert kmp.get_missing_documents_for_kyc() == []
+
+
+def test_derived_values_follow_copy_updates() -> None:
+    copy = make_kmp().model_copy(
+        update={"kyc_completeness": KYCCompleteness.INCOMPLETE, "shareholding_percentage": 50.0}
+    )
+
+    assert not copy.has_complete_kyc
+    assert copy.effective_share == 50.0
+
+
+def test_kmp_lookups_see_direct_appends() -> None:
+    analysis = make_analysis(make_kmp("k1", risk_score=0.2))
+    assert analysis.get_kmp_by_id("k2") is None
+
+    analysis.identified_kmps.append(make_kmp("k2", risk_score=0.4))
+
+    assert analysis.get_kmp_by_id("k2") is not None
+    assert len(analysis.get_kmps_by_role("Partner")) == 2
+    assert abs(analysis.average_individual_risk - 0.3) < 1e-9
+
+
+def test_kmp_lookups_after_add_kmp() -> None:
+    analysis = make_analysis(make_kmp("k1"))
+    analysis.get_kmp_by_id("k1")
+
+    analysis.add_kmp(make_kmp("k2", risk_score=0.6))
+
+    assert analysis.get_kmp_by_id("k2") is not None
+    assert len(analysis.get_kmps_with_complete_kyc()) == 2
+    assert analysis.average_individual_risk == 0.6
+
+
+def test_kmp_lookups_on_constructed_and_copied_analysis() -> None:
+    analysis = make_analysis(make_kmp("k1"))
+    analysis.get_kmp_by_id("k1")
+
+    constructed = KMPAnalysis.model_construct(
+        **{**dict(analysis), "identified_kmps": [make_kmp("k3")]}
+    )
+    copy = analysis.model_copy(update={"identified_kmps": [make_kmp("k2")]})
+
+    assert constructed.get_kmp_by_id("k3") is not None
+    assert copy.get_kmp_by_id("k2") is not None
+    assert copy.get_kmp_by_id("k1") is None
+    assert analysis.get_kmp_by_id("k1") is not None
@@ -0,0 +1,88 @@
+"""Tests for loan application models."""
+
+from datetime import datetime
+
+from msme_underwriting.models.loan_application import LoanApplication, LoanContext, ProcessingOptions, UploadedFile
+
+SUBMITTED = datetime(2024, 1, 2, 3, 4, 5, 678901)
+
+
+def make_context() -> LoanContext:
+    return LoanContext(loan_type="term_loan", loan_amount=1_000_000, application_timestamp=SUBMITTED)
+
+
+def test_timestamp_is_stored_as_epoch_ns() -> None:
+    context = make_context()
+
+    assert context.application_timestamp == 1704164645678901000
+    assert context.application_timestamp_dt == SUBMITTED
+
+
+def test_dumps_emit_datetimes() -> None:
+    context = make_context()
+
+    assert context.model_dump()["application_timestamp"] == SUBMITTED
+    assert '"application_timestamp":"2024-01-02T03:04:05.678901"' in context.model_dump_json()
+
+
+def test_json_round_trip() -> None:
+    context = make_context()
+
+    assert LoanContext.model_validate_json(context.model_dump_json()) == context
+
+
+def test_aware_timestamps_are_normalized_to_utc() -> None:
+    uploaded = UploadedFile(
+        file_name="pan.pdf",
+        file_path="/uploads/pan.pdf",
+        file_size=1024,
+        upload_timestamp="2024-01-02T08:34:05.678901+05:30",
+        file_type="application/pdf",
+    )
+
+    assert uploaded.upload_timestamp == make_context().application_timestamp
+    assert uploaded.model_dump()["upload_timestamp"] == SUBMITTED
+
+
+def make_file(name: str, size: int) -> UploadedFile:
+    return UploadedFile(
+        file_name=name,
+        file_path=f"/uploads/{name}",
+        file_size=size,
+        upload_timestamp=SUBMITTED,
+        file_type="application/pdf",
+    )
+
+
+def make_application(*files: UploadedFile) -> LoanApplication:
+    return LoanApplication(
+        thread_id="t1",
+        user_id="u1",
+        loan_context=make_context(),
+        uploaded_files=list(files),
+        processing_options=ProcessingOptions(),
+    )
+
+
+def test_total_file_size_follows_appends() -> None:
+    application = make_application(make_file("a.pdf", 100))
+    assert application.total_file_size == 100
+
+    application.add_uploaded_file(make_file("b.pdf", 20))
+    application.uploaded_files.append(make_file("c.pdf", 3))
+
+    assert application.total_file_size == 123
+
+
+def test_total_file_size_on_constructed_and_copied_application() -> None:
+    application = make_application(make_file("a.pdf", 100))
+    assert application.total_file_size == 100
+
+    constructed = LoanApplication.model_construct(
+        **{**dict(application), "uploaded_files": [make_file("b.pdf", 7)]}
+    )
+    copy = application.model_copy(update={"uploaded_files": []})
+
+    assert constructed.total_file_size == 7
+    assert copy.total_file_size == 0
+    assert application.total_file_size == 100
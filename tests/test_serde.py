@@ -0,0 +1,82 @@
+"""Tests for the checkpoint model serializer."""
+
+from datetime import datetime
+
+import pytest
+
+from msme_underwriting.models.base import ProcessingMetadata, RoutingDecision
+from msme_underwriting.serde import ModelJsonSerializer
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def serde() -> ModelJsonSerializer:
+    return ModelJsonSerializer()
+
+
+def make_metadata(seconds: float) -> ProcessingMetadata:
+    return ProcessingMetadata(start_time=NOW, end_time=NOW, total_processing_time=seconds)
+
+
+def test_model_round_trip(serde: ModelJsonSerializer) -> None:
+    decision = RoutingDecision(
+        next_agent="financial_analysis",
+        routing_reason="Compliance verified",
+        conditions_met=("bureau_scores_passed",),
+    )
+
+    type_, payload = serde.dumps_typed(decision)
+
+    assert type_ == "model_json"
+    assert payload.startswith(b"msme_underwriting.models.base:RoutingDecision\n")
+    assert serde.loads_typed((type_, payload)) == decision
+
+
+def test_model_list_round_trip(serde: ModelJsonSerializer) -> None:
+    metadata = [make_metadata(1.0), make_metadata(2.5)]
+
+    type_, payload = serde.dumps_typed(metadata)
+
+    assert type_ == "model_list_json"
+    assert serde.loads_typed((type_, payload)) == metadata
+
+
+def test_mixed_list_falls_through(serde: ModelJsonSerializer) -> None:
+    mixed = [make_metadata(1.0), "not a model"]
+
+    type_, _ = serde.dumps_typed(mixed)
+
+    assert type_ not in ("model_json", "model_list_json")
+
+
+def test_other_values_fall_through(serde: ModelJsonSerializer) -> None:
+    value = {"next_action": "final_assembly", "attempts": 2}
+
+    type_, payload = serde.dumps_typed(value)
+
+    assert type_ != "model_json"
+    assert serde.loads_typed((type_, payload)) == value
+
+
+def test_invalid_stored_model_is_constructed(serde: ModelJsonSerializer) -> None:
+    payload = (
+        b"msme_underwriting.models.base:ProcessingMetadata\n"
+        b'{"start_time":"2024-01-01T12:00:00","end_time":"2024-01-01T12:00:00",'
+        b'"total_processing_time":"unknown"}'
+    )
+
+    restored = serde.loads_typed(("model_json", payload))
+
+    assert isinstance(restored, ProcessingMetadata)
+    assert restored.total_processing_time == "unknown"
+
+
+def test_rejects_class_outside_models_package(serde: ModelJsonSerializer) -> None:
+    with pytest.raises(ValueError, match="outside"):
+        serde.loads_typed(("model_json", b"pydantic:BaseModel\n{}"))
+
+
+def test_rejects_non_model_class(serde: ModelJsonSerializer) -> None:
+    with pytest.raises(ValueError, match="Not a model class"):
+        serde.loads_typed(("model_json", b"msme_underwriting.models.kmp:KYCCompleteness\n{}"))
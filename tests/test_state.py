@@ -0,0 +1,120 @@
+"""Tests for the LangGraph workflow state model."""
+
+from datetime import datetime
+
+import pytest
+
+from msme_underwriting.models.base import ProcessingMetadata
+from msme_underwriting.models.documents import MissingDocument, ValidationWarning
+from msme_underwriting.models.loan_application import LoanApplication, LoanContext, ProcessingOptions
+from msme_underwriting.models.state import EventLog, MSMELoanState, _merge_event_logs
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+LATER = datetime(2024, 1, 1, 12, 5, 0)
+
+
+def make_metadata(seconds: float, cost: float) -> ProcessingMetadata:
+    return ProcessingMetadata(
+        start_time=NOW, end_time=NOW, total_processing_time=seconds, total_api_cost=cost
+    )
+
+
+@pytest.fixture
+def state() -> MSMELoanState:
+    application = LoanApplication(
+        thread_id="t1",
+        user_id="u1",
+        loan_context=LoanContext(loan_type="term_loan", loan_amount=1_000_000, application_timestamp=NOW),
+        uploaded_files=[],
+        processing_options=ProcessingOptions(),
+    )
+    return MSMELoanState(thread_id="t1", loan_application=application)
+
+
+def test_totals_follow_reassigned_metadata(state: MSMELoanState) -> None:
+    state.processing_metadata = {"a": make_metadata(1.5, 0.25)}
+
+    assert state.get_total_processing_time() == 1.5
+    assert state.get_total_api_cost() == 0.25
+
+
+def test_totals_follow_in_place_metadata_updates(state: MSMELoanState) -> None:
+    state.processing_metadata["a"] = make_metadata(1.0, 0.5)
+    state.processing_metadata["b"] = make_metadata(2.0, 0.25)
+
+    assert state.get_total_processing_time() == 3.0
+    assert state.get_total_api_cost() == 0.75
+
+
+def test_totals_on_constructed_state(state: MSMELoanState) -> None:
+    constructed = MSMELoanState.model_construct(
+        thread_id="t1",
+        loan_application=state.loan_application,
+        processing_metadata={"a": make_metadata(4.0, 1.0)},
+    )
+
+    assert constructed.get_total_processing_time() == 4.0
+    assert constructed.get_total_api_cost() == 1.0
+
+
+def test_merge_event_logs_concatenates_columns_in_order() -> None:
+    left = EventLog.single("financial_analysis", "ratio missing", NOW, {"field": "dscr"})
+    right = EventLog.single("banking_analysis", "statement gap", LATER)
+
+    merged = _merge_event_logs(left, right)
+
+    assert list(merged.agents) == ["financial_analysis", "banking_analysis"]
+    assert list(merged.messages) == ["ratio missing", "statement gap"]
+    assert list(merged.timestamps) == [NOW, LATER]
+    assert list(merged.details) == [{"field": "dscr"}, None]
+    # The inputs are channel values from earlier steps and must not be mutated
+    assert len(left) == 1 and len(right) == 1
+
+
+def test_merge_event_logs_with_empty_side_returns_other() -> None:
+    log = EventLog.single("verification_compliance", "bureau down", NOW)
+
+    assert _merge_event_logs(EventLog(), log) is log
+    assert _merge_event_logs(log, EventLog()) is log
+
+
+def test_merge_event_logs_accepts_serialized_and_legacy_forms() -> None:
+    legacy = [{"agent": "document_classification", "error": "unreadable", "timestamp": NOW}]
+    dumped = EventLog.single("entity_kmp_identification", "no PAN", LATER).model_dump()
+
+    merged = _merge_event_logs(legacy, dumped)
+
+    assert list(merged.agents) == ["document_classification", "entity_kmp_identification"]
+    assert merged.records("error") == [
+        {"agent": "document_classification", "error": "unreadable", "timestamp": NOW, "details": {}},
+        {"agent": "entity_kmp_identification", "error": "no PAN", "timestamp": LATER, "details": {}},
+    ]
+
+
+def test_errors_property_reads_merged_log(state: MSMELoanState) -> None:
+    state.error_log = _merge_event_logs(state.error_log, EventLog.single("final_assembly", "failed", NOW))
+
+    assert state.has_errors
+    assert state.errors == ({"agent": "final_assembly", "error": "failed", "timestamp": NOW, "details": {}},)
+
+
+def test_errors_view_is_read_only(state: MSMELoanState) -> None:
+    with pytest.raises(AttributeError):
+        state.errors.append({"agent": "final_assembly", "error": "lost"})  # type: ignore[attr-defined]
+
+    state.add_error("final_assembly", "kept")
+    state.extend_errors([("final_assembly", "also kept", None)])
+
+    assert [error["error"] for error in state.errors] == ["kept", "also kept"]
+
+
+def test_document_lists_accept_appends_on_fresh_state(state: MSMELoanState) -> None:
+    other = MSMELoanState(thread_id="t2", loan_application=state.loan_application)
+    missing = MissingDocument(document_type="PAN_CARD", missing_for="entity", mandatory=True, reason="KYC")
+
+    state.add_missing_document(missing)
+    state.add_validation_warning(ValidationWarning(type="low_confidence", recommendation="Re-upload"))
+
+    assert list(state.missing_documents) == [missing]
+    assert len(state.validation_warnings) == 1
+    assert len(other.missing_documents) == 0
@@ -0,0 +1,94 @@
+"""Tests for verification and compliance models."""
+
+from msme_underwriting.models.verification import (
+    BureauVerificationResults,
+    EntityCommercialBureau,
+    KMPConsumerBureau,
+    PolicyComplianceAssessment,
+    PolicyComplianceCheck,
+)
+
+
+def make_check(name: str, status: str) -> PolicyComplianceCheck:
+    return PolicyComplianceCheck(check_name=name, required="x", achieved="x", status=status)
+
+
+def make_assessment() -> PolicyComplianceAssessment:
+    return PolicyComplianceAssessment(
+        bureau_score_compliance={"cibil": make_check("cibil", "pass")},
+        coverage_compliance={},
+        documentation_compliance={},
+        gst_compliance_check={},
+    )
+
+
+def test_overall_status_sees_in_place_writes() -> None:
+    assessment = make_assessment()
+    assessment.coverage_compliance["kmp"] = make_check("kmp", "fail")
+
+    assert assessment.get_overall_status() == "fail"
+    assert assessment.get_check("kmp") == make_check("kmp", "fail")
+
+
+def test_overall_status_on_constructed_model() -> None:
+    assessment = PolicyComplianceAssessment.model_construct(
+        bureau_score_compliance={},
+        coverage_compliance={"kmp": make_check("kmp", "fail")},
+        documentation_compliance={},
+        gst_compliance_check={},
+    )
+
+    assert assessment.get_overall_status() == "fail"
+
+
+def test_overall_status_on_copy_with_replaced_group() -> None:
+    assessment = make_assessment()
+    assessment.add_check("coverage_compliance", "kmp", make_check("kmp", "fail"))
+
+    copy = assessment.model_copy(update={"coverage_compliance": {}})
+
+    assert assessment.get_overall_status() == "fail"
+    assert copy.get_overall_status() == "pass"
+    assert copy.get_check("kmp") is None
+
+
+def test_overall_status_requires_additional_data() -> None:
+    assessment = make_assessment()
+    assessment.add_check("documentation_compliance", "itr", make_check("itr", "requires_additional_data"))
+
+    assert assessment.get_overall_status() == "requires_additional_data"
+
+
+def make_bureau(kmp_id: str) -> KMPConsumerBureau:
+    return KMPConsumerBureau(kmp_id=kmp_id, name="A Partner", pan_number="ABCDE1234F", status="pass")
+
+
+def make_bureau_results(*bureaus: KMPConsumerBureau) -> BureauVerificationResults:
+    return BureauVerificationResults(
+        entity_commercial_bureau=EntityCommercialBureau(bureau_provider="CIBIL", status="pass"),
+        kmp_consumer_bureaus=list(bureaus),
+        total_kmps_checked=len(bureaus),
+        kmps_meeting_threshold=len(bureaus),
+    )
+
+
+def test_bureau_lookup_sees_direct_appends() -> None:
+    results = make_bureau_results(make_bureau("k1"))
+    assert results.get_kmp_bureau_by_id("k2") is None
+
+    results.kmp_consumer_bureaus.append(make_bureau("k2"))
+    results.add_kmp_bureau(make_bureau("k3"))
+
+    assert results.get_kmp_bureau_by_id("k2") is not None
+    assert results.get_kmp_bureau_by_id("k3") is not None
+
+
+def test_bureau_lookup_on_copy_with_replaced_list() -> None:
+    results = make_bureau_results(make_bureau("k1"))
+    assert results.get_kmp_bureau_by_id("k1") is not None
+
+    copy = results.model_copy(update={"kmp_consumer_bureaus": [make_bureau("k2")]})
+
+    assert copy.get_kmp_bureau_by_id("k1") is None
+    assert copy.get_kmp_bureau_by_id("k2") is not None
+    assert results.get_kmp_bureau_by_id("k1") is not None